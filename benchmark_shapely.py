@@ -20,6 +20,7 @@ import sys
 from pathlib import Path
 
 try:
+    import shapely
     from shapely.geometry import Polygon, LineString, MultiPolygon
     from shapely.ops import unary_union
     from svgpathtools import svg2paths2
@@ -29,35 +30,186 @@ except ImportError as e:
     print("Install with: pip install shapely svgpathtools numpy")
     sys.exit(1)
 
+# Shapely 2.0 exposes vectorized ufunc-style operations over geometry arrays.
+SHAPELY_2 = int(shapely.__version__.split(".")[0]) >= 2
+
+
+def gauss_legendre(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Gauss-Legendre nodes and weights mapped onto [0, 1]."""
+    nodes, weights = np.polynomial.legendre.leggauss(n)
+    return (nodes + 1) / 2, weights / 2
+
+
+# Bezier arc lengths use the fine rule; the coarse one estimates its error
+GAUSS_FINE = gauss_legendre(48)
+GAUSS_COARSE = gauss_legendre(24)
+
+
+def bezier_speed_integral(diffs: np.ndarray, rule: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Integrate |B'(t)| over [0, 1] for Beziers with control point differences `diffs`."""
+    nodes, weights = rule
+    degree = diffs.shape[1]
+    # B'(t) is (degree) times the Bezier of the control point differences
+    basis = np.array([
+        math.comb(degree - 1, k) * nodes**k * (1 - nodes)**(degree - 1 - k)
+        for k in range(degree)
+    ])
+    return np.abs(degree * diffs @ basis) @ weights
+
+
+def segment_controls(path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Control points of every path segment, padded to shape (n, 4), and the
+    number of control points per segment (2 line, 3 quadratic, 4 cubic).
+    Arcs have no Bezier form and get 0 and a NaN row.
+    """
+    nan = complex(math.nan, math.nan)
+    orders = np.zeros(len(path), dtype=int)
+    controls = np.full((len(path), 4), nan, dtype=complex)
+    for i, segment in enumerate(path):
+        if hasattr(segment, "bpoints"):
+            control = segment.bpoints()
+            orders[i] = len(control)
+            controls[i, :len(control)] = control
+    return orders, controls
+
+
+def segment_lengths(path, orders: np.ndarray, controls: np.ndarray) -> np.ndarray:
+    """
+    Length of each path segment, matching svgpathtools' segment.length().
+
+    Lines are exact. Bezier curves integrate their speed with a fixed
+    Gauss-Legendre rule over all segments of a degree at once; where a
+    coarser rule disagrees (cusps, sharp turns) and for arcs, fall back
+    to svgpathtools' adaptive quadrature.
+    """
+    lengths = np.empty(len(path))
+    line = orders == 2
+    delta = controls[line, 1] - controls[line, 0]
+    lengths[line] = np.hypot(delta.real, delta.imag)  # same rounding as abs()
+
+    slow = orders == 0
+    for order in (3, 4):
+        mask = orders == order
+        if not mask.any():
+            continue
+        diffs = np.diff(controls[mask, :order], axis=1)
+        fine = bezier_speed_integral(diffs, GAUSS_FINE)
+        coarse = bezier_speed_integral(diffs, GAUSS_COARSE)
+        lengths[mask] = fine
+        slow[mask] = np.abs(fine - coarse) > 1e-10 * np.maximum(fine, 1.0)
+
+    for i in np.flatnonzero(slow):
+        lengths[i] = path[i].length()
+    return lengths
+
+
+def sample_path(path, orders: np.ndarray, controls: np.ndarray, lengths: np.ndarray,
+                out: np.ndarray) -> np.ndarray:
+    """
+    Sample len(out) points at T = i/len(out) along a path, writing them
+    into `out` (shape (n, 2)).
+
+    Mirrors svgpathtools' path.point(T) operation for operation: T is
+    spread over segments by running sums of their normalized lengths,
+    so T on a segment boundary gives local t of exactly 0 or 1, and
+    each segment type is evaluated with svgpathtools' own formula.
+    Returns the filled rows (empty for a zero-length path).
+    """
+    num_samples = len(out)
+    total = np.cumsum(lengths)[-1]  # summed in order, like Python's sum()
+    if total == 0:
+        return out[:0]
+
+    ends = np.cumsum(lengths / total)
+    starts = np.concatenate(([0.0], ends[:-1]))
+
+    T = np.arange(num_samples) / num_samples
+    seg_idx = np.minimum(np.searchsorted(ends, T, side="left"), len(path) - 1)
+    span = ends[seg_idx] - starts[seg_idx]
+    t = np.divide(T - starts[seg_idx], span, out=np.zeros_like(T), where=span > 0)
+    np.clip(t, 0.0, 1.0, out=t)  # rounding in the running sum can overshoot the last end
+
+    points = np.empty(num_samples, dtype=complex)
+    order = orders[seg_idx]
+    c = controls[seg_idx]
+
+    mask = order == 2
+    p0, p1, tm = c[mask, 0], c[mask, 1], t[mask]
+    points[mask] = p0 + (p1 - p0) * tm
+
+    mask = order == 3
+    p0, p1, p2, tm = c[mask, 0], c[mask, 1], c[mask, 2], t[mask]
+    tc = 1 - tm
+    points[mask] = tc * tc * p0 + 2 * tc * tm * p1 + tm * tm * p2
+
+    mask = order == 4
+    p0, p1, p2, p3, tm = c[mask, 0], c[mask, 1], c[mask, 2], c[mask, 3], t[mask]
+    points[mask] = p0 + tm * (
+        3 * (p1 - p0) + tm * (
+            3 * (p0 + p2) - 6 * p1 + tm * (
+                -p0 + 3 * (p1 - p2) + p3
+            )))
+
+    # Arcs have no Bezier form; evaluate them point by point
+    for k in np.flatnonzero(orders == 0):
+        idx = np.flatnonzero(seg_idx == k)
+        points[idx] = [path[k].point(x) for x in t[idx]]
+
+    out[:, 0] = points.real
+    out[:, 1] = points.imag
+    return out
+
 
 def svg_to_polygons(svg_path: str) -> list[Polygon]:
     """Extract polygons from SVG file using svgpathtools."""
     paths, attributes, svg_attributes = svg2paths2(svg_path)
-    polygons = []
 
+    # Size every path first so all samples land in one preallocated buffer
+    sized = []
     for path in paths:
         if len(path) == 0:
             continue
+        orders, controls = segment_controls(path)
+        lengths = segment_lengths(path, orders, controls)
+        sized.append((path, orders, controls, lengths, max(10, int(np.cumsum(lengths)[-1] / 2))))
+
+    buffer = np.empty((sum(n for *_, n in sized), 2))
+    rings = []
+    start = 0
+    for path, orders, controls, lengths, num_samples in sized:
+        out = buffer[start:start + num_samples]
+        points = sample_path(path, orders, controls, lengths, out)
+        start += num_samples
+        if len(points) >= 3:
+            rings.append(points)
 
-        # Sample points along the path
-        points = []
-        num_samples = max(10, int(path.length() / 2))
+    if not rings:
+        return []
 
-        for i in range(num_samples):
-            t = i / num_samples
-            try:
-                pt = path.point(t)
-                points.append((pt.real, pt.imag))
-            except:
-                continue
+    if not SHAPELY_2:
+        return build_polygons_loop(rings)
 
-        if len(points) >= 3:
-            try:
-                poly = Polygon(points)
-                if poly.is_valid and poly.area > 0:
-                    polygons.append(poly)
-            except:
-                continue
+    # Build and validate every polygon in one batch of GEOS calls
+    coords = np.concatenate(rings)
+    index = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+    polygons = shapely.polygons(shapely.linearrings(coords, indices=index))
+    keep = shapely.is_valid(polygons) & (shapely.area(polygons) > 0)
+
+    return list(polygons[keep])
+
+
+def build_polygons_loop(rings: list[np.ndarray]) -> list[Polygon]:
+    """Build valid polygons one at a time (fallback for Shapely < 2.0)."""
+    polygons = []
+
+    for points in rings:
+        try:
+            poly = Polygon(points)
+            if poly.is_valid and poly.area > 0:
+                polygons.append(poly)
+        except Exception:
+            continue
 
     return polygons
 
@@ -66,48 +218,72 @@ def generate_hatch_lines(
     polygon: Polygon,
     spacing: float = 2.5,
     angle_deg: float = 45.0
-) -> list[tuple]:
+) -> np.ndarray:
     """
     Generate hatch lines for a polygon using Shapely.
-    Returns list of ((x1,y1), (x2,y2)) tuples.
+    Returns an array of shape (n, 4), one (x1, y1, x2, y2) row per line.
     """
     if not polygon.is_valid or polygon.is_empty:
-        return []
+        return np.empty((0, 4))
 
     bounds = polygon.bounds  # (minx, miny, maxx, maxy)
     minx, miny, maxx, maxy = bounds
 
-    # Expand bounds to account for rotation
     cx, cy = (minx + maxx) / 2, (miny + maxy) / 2
-    diagonal = math.sqrt((maxx - minx)**2 + (maxy - miny)**2)
+    width, height = maxx - minx, maxy - miny
 
     # Generate parallel lines
     angle_rad = math.radians(angle_deg)
     cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
 
+    # Project the bounds onto the step direction (across the lines) and the
+    # line direction, instead of covering the diagonal both ways
+    extent = abs(width * sin_a) + abs(height * cos_a)
+    half_length = (abs(width * cos_a) + abs(height * sin_a)) / 2 + spacing
+
+    # Whole multiples of the spacing either side of the center, like
+    # hatch.rs, so the extent only decides how many lines, not where they fall
+    k = math.ceil(extent / 2 / spacing) + 1
+    offsets = np.arange(-k, k + 1) * spacing
+    num_lines = len(offsets)
+
+    # Line endpoints for every offset at once (extend beyond bounds),
+    # shape (num_lines, 2, 2) = [line][endpoint][x/y]
+    mid_x = cx + offsets * (-sin_a)
+    mid_y = cy + offsets * cos_a
+    coords = np.empty((num_lines, 2, 2))
+    coords[:, 0, 0] = mid_x - half_length * cos_a
+    coords[:, 0, 1] = mid_y - half_length * sin_a
+    coords[:, 1, 0] = mid_x + half_length * cos_a
+    coords[:, 1, 1] = mid_y + half_length * sin_a
+
+    if not SHAPELY_2:
+        return clip_hatch_lines_loop(coords, polygon)
+
+    # Clip all lines in one GEOS call, then flatten Multi* results into parts
+    lines_arr = shapely.linestrings(coords)
+    clipped = shapely.intersection(lines_arr, polygon)
+    parts = shapely.get_parts(clipped)
+    parts = parts[shapely.get_type_id(parts) == shapely.GeometryType.LINESTRING]
+
+    xy, index = shapely.get_coordinates(parts, return_index=True)
+    counts = np.bincount(index, minlength=len(parts))
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    keep = counts >= 2
+
+    return np.hstack((xy[starts[keep]], xy[ends[keep] - 1]))
+
+
+def clip_hatch_lines_loop(endpoints: np.ndarray, polygon: Polygon) -> np.ndarray:
+    """
+    Clip hatch lines one at a time (fallback for Shapely < 2.0).
+    Returns an array of shape (n, 4), one (x1, y1, x2, y2) row per line.
+    """
     lines = []
 
-    # Line direction perpendicular to angle
-    dx, dy = cos_a, sin_a
-    # Step direction (perpendicular to line direction)
-    step_x, step_y = -sin_a * spacing, cos_a * spacing
-
-    # Number of lines needed
-    num_lines = int(diagonal / spacing) + 2
-
-    # Starting point (offset from center)
-    start_offset = -num_lines * spacing / 2
-
-    for i in range(num_lines):
-        offset = start_offset + i * spacing
-
-        # Line endpoints (extend beyond bounds)
-        p1_x = cx + offset * (-sin_a) - diagonal * cos_a
-        p1_y = cy + offset * cos_a - diagonal * sin_a
-        p2_x = cx + offset * (-sin_a) + diagonal * cos_a
-        p2_y = cy + offset * cos_a + diagonal * sin_a
-
-        line = LineString([(p1_x, p1_y), (p2_x, p2_y)])
+    for (p1, p2) in endpoints:
+        line = LineString([tuple(p1), tuple(p2)])
 
         # Clip to polygon
         try:
@@ -120,16 +296,16 @@ def generate_hatch_lines(
             if clipped.geom_type == 'LineString':
                 coords = list(clipped.coords)
                 if len(coords) >= 2:
-                    lines.append((coords[0], coords[-1]))
+                    lines.append((*coords[0][:2], *coords[-1][:2]))
             elif clipped.geom_type == 'MultiLineString':
                 for geom in clipped.geoms:
                     coords = list(geom.coords)
                     if len(coords) >= 2:
-                        lines.append((coords[0], coords[-1]))
+                        lines.append((*coords[0][:2], *coords[-1][:2]))
         except Exception:
             continue
 
-    return lines
+    return np.array(lines, dtype=float).reshape(-1, 4)
 
 
 def benchmark_shapely(svg_path: str, spacing: float = 2.5, angle: float = 45.0):
@@ -149,31 +149,24 @@ pub fn cmd_analyze(args: &[String]) {
         }
     };
 
-    // Read content and get file size
-    let (content, file_size) = if svg_path == "-" {
+    // Read content; its byte length is the file size, so no separate
+    // metadata lookup is needed
+    let content = if svg_path == "-" {
         // Read from stdin
         let mut buffer = String::new();
         io::stdin().read_to_string(&mut buffer).unwrap_or_else(|e| {
             eprintln!("Error: Failed to read from stdin: {}", e);
             std::process::exit(1);
         });
-        let size = buffer.len() as u64;
-        (buffer, size)
+        buffer
     } else {
-        // Read from file
-        let file_size = fs::metadata(svg_path)
-            .map(|m| m.len())
-            .unwrap_or_else(|e| {
-                eprintln!("Error: Cannot read file '{}': {}", svg_path, e);
-                std::process::exit(1);
-            });
-
-        let content = fs::read_to_string(svg_path).unwrap_or_else(|e| {
-            eprintln!("Error: Failed to read '{}': {}", svg_path, e);
+        // Read from file (sized up front from the file's length)
+        fs::read_to_string(svg_path).unwrap_or_else(|e| {
+            eprintln!("Error: Cannot read file '{}': {}", svg_path, e);
             std::process::exit(1);
-        });
-        (content, file_size)
+        })
     };
+    let file_size = content.len() as u64;
 
     // Pass 1: Streaming analysis (always)
     let mut analyzer = streaming::StreamingAnalyzer::new();
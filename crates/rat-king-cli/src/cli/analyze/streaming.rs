@@ -18,6 +18,13 @@ struct GroupInfoBuilder {
     colors: HashMap<String, usize>,
 }
 
+/// Which color table a color occurrence is counted in.
+#[derive(Clone, Copy)]
+enum ColorKind {
+    Fill,
+    Stroke,
+}
+
 /// Streaming analyzer for SVG files.
 ///
 /// Uses quick-xml to parse SVG content without building a full tree,
@@ -68,10 +75,10 @@ impl StreamingAnalyzer {
         let mut reader = Reader::from_str(content);
         reader.config_mut().trim_text(true);
 
-        let mut buf = Vec::new();
-
+        // Events borrow straight from `content`; nothing is copied into an
+        // intermediate buffer per element
         loop {
-            match reader.read_event_into(&mut buf) {
+            match reader.read_event() {
                 Ok(Event::Start(ref e)) => {
                     self.process_start_element(e, false)?;
                 }
@@ -85,7 +92,6 @@ impl StreamingAnalyzer {
                 Err(e) => return Err(format!("XML parse error at position {}: {}", reader.error_position(), e)),
                 _ => {}
             }
-            buf.clear();
         }
 
         Ok(self.build_summary(file_size))
@@ -313,20 +319,8 @@ impl StreamingAnalyzer {
             let value = std::str::from_utf8(&attr.value).unwrap_or("");
 
             match key {
-                "fill" => {
-                    if !value.is_empty() && value != "none" {
-                        let normalized = normalize_color(value);
-                        *self.fill_colors.entry(normalized.clone()).or_insert(0) += 1;
-                        self.track_group_color(&normalized);
-                    }
-                }
-                "stroke" => {
-                    if !value.is_empty() && value != "none" {
-                        let normalized = normalize_color(value);
-                        *self.stroke_colors.entry(normalized.clone()).or_insert(0) += 1;
-                        self.track_group_color(&normalized);
-                    }
-                }
+                "fill" => self.count_color(ColorKind::Fill, value),
+                "stroke" => self.count_color(ColorKind::Stroke, value),
                 "style" => {
                     // Parse inline CSS style for fill/stroke
                     self.parse_style_attr(value);
@@ -338,11 +332,21 @@ impl StreamingAnalyzer {
         Ok(())
     }
 
-    /// Track a color for the current top-level group.
-    fn track_group_color(&mut self, color: &str) {
+    /// Count a fill or stroke color, and track it for the current top-level group.
+    fn count_color(&mut self, kind: ColorKind, value: &str) {
+        if value.is_empty() || value == "none" {
+            return;
+        }
+
+        let normalized = normalize_color(value);
         if let Some(idx) = self.current_top_group_idx {
-            *self.top_groups[idx].colors.entry(color.to_string()).or_insert(0) += 1;
+            increment_color(&mut self.top_groups[idx].colors, &normalized);
         }
+        let colors = match kind {
+            ColorKind::Fill => &mut self.fill_colors,
+            ColorKind::Stroke => &mut self.stroke_colors,
+        };
+        *colors.entry(normalized).or_insert(0) += 1;
     }
 
     fn parse_style_attr(&mut self, style: &str) {
@@ -350,19 +354,9 @@ impl StreamingAnalyzer {
         for part in style.split(';') {
             let part = part.trim();
             if let Some(value) = part.strip_prefix("fill:") {
-                let value = value.trim();
-                if !value.is_empty() && value != "none" {
-                    let normalized = normalize_color(value);
-                    *self.fill_colors.entry(normalized.clone()).or_insert(0) += 1;
-                    self.track_group_color(&normalized);
-                }
+                self.count_color(ColorKind::Fill, value.trim());
             } else if let Some(value) = part.strip_prefix("stroke:") {
-                let value = value.trim();
-                if !value.is_empty() && value != "none" {
-                    let normalized = normalize_color(value);
-                    *self.stroke_colors.entry(normalized.clone()).or_insert(0) += 1;
-                    self.track_group_color(&normalized);
-                }
+                self.count_color(ColorKind::Stroke, value.trim());
             }
         }
     }
@@ -396,24 +390,34 @@ impl StreamingAnalyzer {
     }
 }
 
+/// Increment a color's count, only allocating the key the first time it is seen.
+fn increment_color(colors: &mut HashMap<String, usize>, color: &str) {
+    match colors.get_mut(color) {
+        Some(count) => *count += 1,
+        None => {
+            colors.insert(color.to_string(), 1);
+        }
+    }
+}
+
 /// Parse viewBox attribute value.
 fn parse_viewbox(value: &str) -> Option<ViewBox> {
-    // viewBox can be comma or space separated
-    let parts: Vec<&str> = value.split(|c| c == ',' || c == ' ')
-        .map(|s| s.trim())
-        .filter(|s| !s.is_empty())
-        .collect();
-
-    if parts.len() == 4 {
-        Some(ViewBox {
-            min_x: parts[0].parse().ok()?,
-            min_y: parts[1].parse().ok()?,
-            width: parts[2].parse().ok()?,
-            height: parts[3].parse().ok()?,
-        })
-    } else {
-        None
-    }
+    // viewBox can be comma and/or whitespace separated; parse the numbers
+    // in one pass instead of collecting the pieces first
+    let mut parts = value
+        .split(|c: char| c == ',' || c.is_ascii_whitespace())
+        .filter(|s| !s.is_empty());
+    let mut next = || parts.next()?.parse().ok();
+
+    let view_box = ViewBox {
+        min_x: next()?,
+        min_y: next()?,
+        width: next()?,
+        height: next()?,
+    };
+
+    // Exactly four numbers
+    parts.next().is_none().then_some(view_box)
 }
 
 /// Normalize color value (lowercase, trim whitespace).
@@ -466,6 +470,13 @@ mod tests {
 
         let vb = parse_viewbox("0, 0, 100, 200").unwrap();
         assert_eq!(vb.width, 100.0);
+
+        let vb = parse_viewbox("0\t0\n100,200").unwrap();
+        assert_eq!(vb.height, 200.0);
+
+        assert!(parse_viewbox("0 0 100").is_none());
+        assert!(parse_viewbox("0 0 100 200 5").is_none());
+        assert!(parse_viewbox("0 0 abc 200").is_none());
     }
 
     #[test]
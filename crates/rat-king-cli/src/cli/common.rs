@@ -1,6 +1,10 @@
 //! Common utilities shared across CLI commands.
 
-use rat_king::{Chain, Line, Pattern, Polygon};
+use std::io::{self, Write};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::thread;
+
+use rat_king::{Chain, Line, Pattern, Point, Polygon};
 
 /// Output format for generated lines.
 #[derive(Clone, Copy, PartialEq)]
@@ -16,63 +20,114 @@ pub fn generate_pattern(pattern: Pattern, polygon: &Polygon, spacing: f64, angle
     pattern.generate(polygon, spacing, angle)
 }
 
-/// Convert lines to SVG output (individual <line> elements).
-pub fn lines_to_svg(lines: &[Line], original_svg: &str) -> String {
+/// Run `generate` for every polygon index across all CPU cores.
+///
+/// Polygons fill independently, so the indices are cut into small chunks
+/// that worker threads pull from a shared counter - a few huge polygons
+/// can't leave the other cores idle. Results come back in the same order
+/// as `indices`, so output is identical to a sequential loop.
+pub fn generate_parallel<F>(indices: &[usize], generate: F) -> Vec<Vec<Line>>
+where
+    F: Fn(usize) -> Vec<Line> + Sync,
+{
+    let workers = thread::available_parallelism().map_or(1, |n| n.get());
+    generate_with_workers(indices, workers, generate)
+}
+
+/// `generate_parallel` with an explicit upper bound on worker threads.
+fn generate_with_workers<F>(indices: &[usize], workers: usize, generate: F) -> Vec<Vec<Line>>
+where
+    F: Fn(usize) -> Vec<Line> + Sync,
+{
+    let workers = workers.min(indices.len());
+    if workers <= 1 {
+        return indices.iter().map(|&idx| generate(idx)).collect();
+    }
+
+    // Several chunks per worker so uneven polygons still balance out
+    let chunk_size = indices.len().div_ceil(workers * 8);
+    let chunks: Vec<&[usize]> = indices.chunks(chunk_size).collect();
+    let next_chunk = AtomicUsize::new(0);
+    let (chunks, next_chunk, generate) = (&chunks, &next_chunk, &generate);
+
+    let mut done: Vec<(usize, Vec<Vec<Line>>)> = thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                scope.spawn(move || {
+                    let mut finished: Vec<(usize, Vec<Vec<Line>>)> = Vec::new();
+                    loop {
+                        let chunk_idx = next_chunk.fetch_add(1, Ordering::Relaxed);
+                        let Some(chunk) = chunks.get(chunk_idx) else {
+                            break;
+                        };
+                        finished.push((chunk_idx, chunk.iter().map(|&idx| generate(idx)).collect()));
+                    }
+                    finished
+                })
+            })
+            .collect();
+
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().expect("Pattern worker thread panicked"))
+            .collect()
+    });
+
+    done.sort_unstable_by_key(|(chunk_idx, _)| *chunk_idx);
+    done.into_iter().flat_map(|(_, lines)| lines).collect()
+}
+
+/// Write lines as SVG output (individual <line> elements) to `out`.
+pub fn lines_to_svg(out: &mut dyn Write, lines: &[Line], original_svg: &str) -> io::Result<()> {
     let viewbox = extract_viewbox(original_svg).unwrap_or_else(|| "0 0 1000 1000".to_string());
 
-    let mut svg = String::new();
-    svg.push_str(&format!(
+    write!(
+        out,
         r#"<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="{}">
 <g stroke="black" stroke-width="0.5" fill="none">
 "#,
         viewbox
-    ));
+    )?;
 
     for line in lines {
-        svg.push_str(&format!(
-            "  <line x1=\"{:.2}\" y1=\"{:.2}\" x2=\"{:.2}\" y2=\"{:.2}\"/>\n",
+        writeln!(
+            out,
+            "  <line x1=\"{:.2}\" y1=\"{:.2}\" x2=\"{:.2}\" y2=\"{:.2}\"/>",
             line.x1, line.y1, line.x2, line.y2
-        ));
+        )?;
     }
 
-    svg.push_str("</g>\n</svg>\n");
-    svg
+    out.write_all(b"</g>\n</svg>\n")
 }
 
-/// Convert chains to SVG output (polyline elements).
+/// Write chains as SVG output (polyline elements) to `out`.
 ///
 /// This produces much smaller output than individual lines by chaining
 /// connected line segments into continuous polylines.
-pub fn chains_to_svg(chains: &[Chain], original_svg: &str) -> String {
+pub fn chains_to_svg(out: &mut dyn Write, chains: &[Chain], original_svg: &str) -> io::Result<()> {
     let viewbox = extract_viewbox(original_svg).unwrap_or_else(|| "0 0 1000 1000".to_string());
 
-    let mut svg = String::new();
-    svg.push_str(&format!(
+    write!(
+        out,
         r#"<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="{}">
 <g stroke="black" stroke-width="0.5" fill="none">
 "#,
         viewbox
-    ));
+    )?;
 
     for chain in chains {
         if chain.len() < 2 {
             continue;
         }
 
-        // Build points string: "x1,y1 x2,y2 x3,y3 ..."
-        let points: String = chain
-            .iter()
-            .map(|p| format!("{:.2},{:.2}", p.x, p.y))
-            .collect::<Vec<_>>()
-            .join(" ");
-
-        svg.push_str(&format!("  <polyline points=\"{}\"/>\n", points));
+        out.write_all(b"  <polyline points=\"")?;
+        write_points(out, chain)?;
+        out.write_all(b"\"/>\n")?;
     }
 
-    svg.push_str("</g>\n</svg>\n");
-    svg
+    out.write_all(b"</g>\n</svg>\n")
 }
 
 /// A group of chains with styling information.
@@ -89,121 +144,124 @@ pub struct Boundary {
     pub stroke_width: f64,
 }
 
-/// Convert grouped chains to SVG output with per-group colors.
-pub fn grouped_chains_to_svg(groups: &[StyledGroup], original_svg: &str) -> String {
+/// Write grouped chains as SVG output with per-group colors to `out`.
+pub fn grouped_chains_to_svg(out: &mut dyn Write, groups: &[StyledGroup], original_svg: &str) -> io::Result<()> {
     let viewbox = extract_viewbox(original_svg).unwrap_or_else(|| "0 0 1000 1000".to_string());
 
-    let mut svg = String::new();
-    svg.push_str(&format!(
+    write!(
+        out,
         r#"<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="{}">
 "#,
         viewbox
-    ));
+    )?;
 
     for group in groups {
-        svg.push_str(&format!(
+        write!(
+            out,
             r#"<g id="{}" stroke="{}" stroke-width="0.5" fill="none" stroke-linecap="round">
 "#,
             group.group_id, group.color
-        ));
+        )?;
 
         for chain in &group.chains {
             if chain.len() < 2 {
                 continue;
             }
 
-            let points: String = chain
-                .iter()
-                .map(|p| format!("{:.2},{:.2}", p.x, p.y))
-                .collect::<Vec<_>>()
-                .join(" ");
-
-            svg.push_str(&format!("  <polyline points=\"{}\"/>\n", points));
+            out.write_all(b"  <polyline points=\"")?;
+            write_points(out, chain)?;
+            out.write_all(b"\"/>\n")?;
         }
 
-        svg.push_str("</g>\n");
+        out.write_all(b"</g>\n")?;
     }
 
-    svg.push_str("</svg>\n");
-    svg
+    out.write_all(b"</svg>\n")
 }
 
-/// Convert grouped chains to SVG with optional boundaries on top.
+/// Write grouped chains as SVG with optional boundaries on top to `out`.
 ///
 /// Output structure:
 /// - `<g id="fills">` - all fill patterns grouped by color
 /// - `<g id="boundaries">` - original polygon boundaries (if provided)
 pub fn grouped_chains_with_boundaries_to_svg(
+    out: &mut dyn Write,
     groups: &[StyledGroup],
     boundaries: &[Boundary],
     original_svg: &str,
-) -> String {
+) -> io::Result<()> {
     let viewbox = extract_viewbox(original_svg).unwrap_or_else(|| "0 0 1000 1000".to_string());
 
-    let mut svg = String::new();
-    svg.push_str(&format!(
+    write!(
+        out,
         r#"<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="{}">
 <g id="fills">
 "#,
         viewbox
-    ));
+    )?;
 
     // Output fills
     for group in groups {
-        svg.push_str(&format!(
+        write!(
+            out,
             r#"<g id="{}" stroke="{}" stroke-width="0.5" fill="none" stroke-linecap="round">
 "#,
             group.group_id, group.color
-        ));
+        )?;
 
         for chain in &group.chains {
             if chain.len() < 2 {
                 continue;
             }
 
-            let points: String = chain
-                .iter()
-                .map(|p| format!("{:.2},{:.2}", p.x, p.y))
-                .collect::<Vec<_>>()
-                .join(" ");
-
-            svg.push_str(&format!("  <polyline points=\"{}\"/>\n", points));
+            out.write_all(b"  <polyline points=\"")?;
+            write_points(out, chain)?;
+            out.write_all(b"\"/>\n")?;
         }
 
-        svg.push_str("</g>\n");
+        out.write_all(b"</g>\n")?;
     }
 
-    svg.push_str("</g>\n");
+    out.write_all(b"</g>\n")?;
 
     // Output boundaries on top
     if !boundaries.is_empty() {
-        svg.push_str("<g id=\"boundaries\" fill=\"none\">\n");
+        out.write_all(b"<g id=\"boundaries\" fill=\"none\">\n")?;
 
         for boundary in boundaries {
             if boundary.points.len() < 2 {
                 continue;
             }
 
-            let points: String = boundary
-                .points
-                .iter()
-                .map(|p| format!("{:.2},{:.2}", p.x, p.y))
-                .collect::<Vec<_>>()
-                .join(" ");
-
-            svg.push_str(&format!(
-                "  <polyline points=\"{}\" stroke=\"{}\" stroke-width=\"{:.2}\"/>\n",
-                points, boundary.color, boundary.stroke_width
-            ));
+            out.write_all(b"  <polyline points=\"")?;
+            write_points(out, &boundary.points)?;
+            writeln!(
+                out,
+                "\" stroke=\"{}\" stroke-width=\"{:.2}\"/>",
+                boundary.color, boundary.stroke_width
+            )?;
         }
 
-        svg.push_str("</g>\n");
+        out.write_all(b"</g>\n")?;
     }
 
-    svg.push_str("</svg>\n");
-    svg
+    out.write_all(b"</svg>\n")
+}
+
+/// Write polyline points as "x1,y1 x2,y2 x3,y3 ...".
+///
+/// Writes each coordinate pair directly to `out` instead of formatting a
+/// String per point and joining them.
+fn write_points(out: &mut dyn Write, points: &[Point]) -> io::Result<()> {
+    for (i, p) in points.iter().enumerate() {
+        if i > 0 {
+            out.write_all(b" ")?;
+        }
+        write!(out, "{:.2},{:.2}", p.x, p.y)?;
+    }
+    Ok(())
 }
 
 /// Extract viewBox from SVG content.
@@ -224,3 +282,53 @@ pub fn extract_viewbox(svg: &str) -> Option<String> {
     }
     None
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// A different number of lines per index (including none), so a
+    /// misplaced or dropped result shows up in the comparison. Some
+    /// indices are slow, so workers finish their chunks out of order.
+    fn lines_for(idx: usize) -> Vec<Line> {
+        if idx % 25 == 0 {
+            thread::sleep(std::time::Duration::from_millis(1));
+        }
+        (0..idx % 4)
+            .map(|k| Line::new(idx as f64, k as f64, idx as f64 + 1.0, -(k as f64)))
+            .collect()
+    }
+
+    fn sequential(indices: &[usize]) -> Vec<Vec<Line>> {
+        indices.iter().map(|&idx| lines_for(idx)).collect()
+    }
+
+    #[test]
+    fn generate_parallel_keeps_permuted_order() {
+        // 7919 is coprime with 500, so this visits every index once out of order
+        let indices: Vec<usize> = (0..500).map(|i| (i * 7919) % 500).collect();
+        assert_eq!(generate_with_workers(&indices, 4, lines_for), sequential(&indices));
+        assert_eq!(generate_parallel(&indices, lines_for), sequential(&indices));
+    }
+
+    #[test]
+    fn generate_parallel_with_more_chunks_than_workers() {
+        // 3 workers split 1000 indices into 24 chunks of 42, the last one short
+        let indices: Vec<usize> = (0..1000).rev().collect();
+        assert_eq!(generate_with_workers(&indices, 3, lines_for), sequential(&indices));
+    }
+
+    #[test]
+    fn generate_parallel_with_fewer_indices_than_workers() {
+        for indices in [vec![3], vec![2, 1], vec![5, 0, 7]] {
+            assert_eq!(generate_with_workers(&indices, 16, lines_for), sequential(&indices));
+            assert_eq!(generate_parallel(&indices, lines_for), sequential(&indices));
+        }
+    }
+
+    #[test]
+    fn generate_parallel_with_no_indices() {
+        assert!(generate_with_workers(&[], 4, lines_for).is_empty());
+        assert!(generate_parallel(&[], lines_for).is_empty());
+    }
+}
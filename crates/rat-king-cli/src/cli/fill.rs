@@ -2,20 +2,20 @@
 
 use std::collections::HashMap;
 use std::fs;
-use std::io::{self, Read};
+use std::io::{self, BufWriter, Read, Write};
 use std::time::Instant;
 
-use serde::{Deserialize, Serialize};
+use serde::{Deserialize, Serialize, Serializer};
 
 use rat_king::{
-    chain_lines, ChainConfig, ChainStats,
-    extract_polygons_from_svg, Line, Pattern, Polygon,
+    chain_lines, Chain, ChainConfig, ChainStats,
+    extract_polygons_from_svg, Line, Pattern, Point, Polygon,
     order_polygons, calculate_travel_distance, OrderingStrategy,
     SketchyConfig, sketchify_lines, polygon_to_lines,
 };
 
 use super::common::{
-    OutputFormat, generate_pattern, lines_to_svg, chains_to_svg,
+    OutputFormat, generate_pattern, generate_parallel, lines_to_svg, chains_to_svg,
     grouped_chains_to_svg, grouped_chains_with_boundaries_to_svg,
     StyledGroup, Boundary,
 };
@@ -36,8 +36,27 @@ struct JsonPoint {
     y: f64,
 }
 
-/// A chain (polyline) in JSON output format.
-type JsonChain = Vec<JsonPoint>;
+/// A chain (polyline) in JSON output format: a list of points.
+struct JsonChain<'a>(&'a [Point]);
+
+impl Serialize for JsonChain<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_seq(self.0.iter().map(|p| JsonPoint { x: p.x, y: p.y }))
+    }
+}
+
+/// Serialize lines as JSON line objects straight from the generated
+/// `Line`s, rather than copying them into a `Vec<JsonLine>` first.
+fn serialize_lines<S: Serializer>(lines: &[Line], serializer: S) -> Result<S::Ok, S::Error> {
+    serializer.collect_seq(lines.iter().map(|l| JsonLine {
+        x1: l.x1, y1: l.y1, x2: l.x2, y2: l.y2,
+    }))
+}
+
+/// Serialize chains as lists of JSON points without an intermediate copy.
+fn serialize_chains<S: Serializer>(chains: &[Chain], serializer: S) -> Result<S::Ok, S::Error> {
+    serializer.collect_seq(chains.iter().map(|chain| JsonChain(chain)))
+}
 
 /// Chaining statistics for JSON output.
 #[derive(Serialize)]
@@ -54,14 +73,17 @@ struct JsonShape {
     #[serde(skip_serializing_if = "Option::is_none")]
     id: Option<String>,
     index: usize,
-    lines: Vec<JsonLine>,
+    #[serde(serialize_with = "serialize_lines")]
+    lines: Vec<Line>,
 }
 
 /// JSON output with all lines (flat mode) - includes both lines and chains.
 #[derive(Serialize)]
-struct JsonOutputFlat {
-    lines: Vec<JsonLine>,
-    chains: Vec<JsonChain>,
+struct JsonOutputFlat<'a> {
+    #[serde(serialize_with = "serialize_lines")]
+    lines: &'a [Line],
+    #[serde(serialize_with = "serialize_chains")]
+    chains: &'a [Chain],
     chain_stats: JsonChainStats,
 }
 
@@ -421,22 +443,25 @@ pub fn cmd_fill(args: &[String]) {
         }
     };
 
-    // Generate output
-    let output = match (format, grouped) {
+    // Generate output, streaming it to the destination once it is ready
+    match (format, grouped) {
         (OutputFormat::Json, true) => {
+            let per_shape = generate_parallel(&order, |idx| {
+                let polygon = &polygons[idx];
+                let lines = generate_pattern(pattern, polygon, spacing, angle);
+                post_process(lines, polygon)
+            });
+
             let shapes: Vec<JsonShape> = order
                 .iter()
-                .map(|&idx| {
+                .zip(per_shape)
+                .map(|(&idx, lines)| {
                     let polygon = &polygons[idx];
-                    let lines = generate_pattern(pattern, polygon, spacing, angle);
-                    let lines = post_process(lines, polygon);
                     let lines = apply_sketchy(lines);
                     JsonShape {
                         id: polygon.id.clone(),
                         index: idx,
-                        lines: lines.iter().map(|l| JsonLine {
-                            x1: l.x1, y1: l.y1, x2: l.x2, y2: l.y2,
-                        }).collect(),
+                        lines,
                     }
                 })
                 .collect();
@@ -450,16 +475,16 @@ pub fn cmd_fill(args: &[String]) {
                 }
             }
 
-            serde_json::to_string(&JsonOutputGrouped { shapes }).expect("Failed to serialize JSON")
+            write_output(output_path, quiet, |out| {
+                serde_json::to_writer(out, &JsonOutputGrouped { shapes }).map_err(io::Error::from)
+            });
         }
         (OutputFormat::Json, false) => {
-            let mut all_lines: Vec<Line> = Vec::new();
-            for &idx in &order {
+            let all_lines: Vec<Line> = generate_parallel(&order, |idx| {
                 let polygon = &polygons[idx];
                 let lines = generate_pattern(pattern, polygon, spacing, angle);
-                let lines = post_process(lines, polygon);
-                all_lines.extend(lines);
-            }
+                post_process(lines, polygon)
+            }).concat();
             let all_lines = apply_sketchy(all_lines);
 
             // Chain lines for JSON output (includes both raw lines and chains)
@@ -476,14 +501,6 @@ pub fn cmd_fill(args: &[String]) {
                 }
             }
 
-            let json_lines: Vec<JsonLine> = all_lines.iter().map(|l| JsonLine {
-                x1: l.x1, y1: l.y1, x2: l.x2, y2: l.y2,
-            }).collect();
-
-            let json_chains: Vec<JsonChain> = chains.iter().map(|chain| {
-                chain.iter().map(|p| JsonPoint { x: p.x, y: p.y }).collect()
-            }).collect();
-
             let json_stats = JsonChainStats {
                 input_lines: stats.input_lines,
                 output_chains: stats.output_chains,
@@ -491,11 +508,13 @@ pub fn cmd_fill(args: &[String]) {
                 avg_chain_length: stats.avg_chain_length,
             };
 
-            serde_json::to_string(&JsonOutputFlat {
-                lines: json_lines,
-                chains: json_chains,
-                chain_stats: json_stats,
-            }).expect("Failed to serialize JSON")
+            write_output(output_path, quiet, |out| {
+                serde_json::to_writer(out, &JsonOutputFlat {
+                    lines: &all_lines,
+                    chains: &chains,
+                    chain_stats: json_stats,
+                }).map_err(io::Error::from)
+            });
         }
         (OutputFormat::Svg, _) => {
             // Load config if provided
@@ -522,27 +541,28 @@ pub fn cmd_fill(args: &[String]) {
                     groups_map.entry(group_id).or_default().push(idx);
                 }
 
-                // Generate lines for each group
-                let mut styled_groups: Vec<StyledGroup> = Vec::new();
-                let mut total_lines = 0;
-
-                for (group_id, polygon_indices) in &groups_map {
-                    let mut group_lines: Vec<Line> = Vec::new();
-                    let mut group_color = "#000000".to_string();
+                // Resolve every polygon's pattern settings up front, so the
+                // fills themselves can run in parallel across all groups
+                let mut poly_settings = vec![(pattern, spacing, angle); polygons.len()];
+                let mut group_colors: Vec<String> = Vec::with_capacity(groups_map.len());
+
+                for polygon_indices in groups_map.values() {
+                    // Every polygon in a group shares its group_id, so the config
+                    // lookup is resolved once per group rather than per polygon
+                    // Priority for each attribute: data-* > config group > command-line
+                    let group_key = polygon_indices.first()
+                        .and_then(|&idx| polygons[idx].group_id.as_deref());
+                    let (base_pattern, base_spacing, base_angle, base_color) = if let Some(ref config) = fill_config {
+                        let resolved = config.get_for_group(group_key);
+                        let pat = Pattern::from_name(&resolved.pattern).unwrap_or(pattern);
+                        (pat, resolved.spacing, resolved.angle, resolved.color)
+                    } else {
+                        (pattern, spacing, angle, "#000000".to_string())
+                    };
 
                     for &idx in polygon_indices {
                         let polygon = &polygons[idx];
 
-                        // Priority for each attribute: data-* > config group > command-line
-                        // Get base config values
-                        let (base_pattern, base_spacing, base_angle, base_color) = if let Some(ref config) = fill_config {
-                            let resolved = config.get_for_group(polygon.group_id.as_deref());
-                            let pat = Pattern::from_name(&resolved.pattern).unwrap_or(pattern);
-                            (pat, resolved.spacing, resolved.angle, resolved.color)
-                        } else {
-                            (pattern, spacing, angle, "#000000".to_string())
-                        };
-
                         // Override with data-* attributes if present
                         let poly_pattern = polygon.data_pattern.as_ref()
                             .and_then(|name| Pattern::from_name(name))
@@ -550,23 +570,47 @@ pub fn cmd_fill(args: &[String]) {
                         let poly_spacing = polygon.data_spacing.unwrap_or(base_spacing);
                         let poly_angle = polygon.data_angle.unwrap_or(base_angle);
 
-                        // Color priority: data-color > stroke_color > config > default
-                        let poly_color = polygon.data_color.clone()
-                            .or_else(|| polygon.stroke_color.clone())
-                            .unwrap_or(base_color);
+                        poly_settings[idx] = (poly_pattern, poly_spacing, poly_angle);
+                    }
+
+                    // The group takes the color of its last polygon
+                    // Color priority: data-color > stroke_color > config > default
+                    let group_color = match polygon_indices.last() {
+                        Some(&idx) => {
+                            let polygon = &polygons[idx];
+                            polygon.data_color.clone()
+                                .or_else(|| polygon.stroke_color.clone())
+                                .unwrap_or(base_color)
+                        }
+                        None => "#000000".to_string(),
+                    };
+                    group_colors.push(group_color);
+                }
 
-                        group_color = poly_color;
+                // Generate every group's polygons in one parallel pass; results
+                // come back in the same group-by-group order as the indices
+                let group_order: Vec<usize> = groups_map.values().flatten().copied().collect();
+                let mut per_polygon = generate_parallel(&group_order, |idx| {
+                    let polygon = &polygons[idx];
+                    let (poly_pattern, poly_spacing, poly_angle) = poly_settings[idx];
+                    let lines = generate_pattern(poly_pattern, polygon, poly_spacing, poly_angle);
+                    post_process(lines, polygon)
+                }).into_iter();
 
-                        let lines = generate_pattern(poly_pattern, polygon, poly_spacing, poly_angle);
-                        let lines = post_process(lines, polygon);
-                        group_lines.extend(lines);
-                    }
+                let mut styled_groups: Vec<StyledGroup> = Vec::with_capacity(groups_map.len());
+                let mut total_lines = 0;
+                let chain_config_inner = ChainConfig::with_tolerance(chain_tolerance);
+
+                for ((group_id, polygon_indices), group_color) in groups_map.iter().zip(group_colors) {
+                    let group_lines: Vec<Line> = per_polygon.by_ref()
+                        .take(polygon_indices.len())
+                        .flatten()
+                        .collect();
 
                     let group_lines = apply_sketchy(group_lines);
                     total_lines += group_lines.len();
 
                     // Chain lines within this group
-                    let chain_config_inner = ChainConfig::with_tolerance(chain_tolerance);
                     let chains = chain_lines(&group_lines, &chain_config_inner);
 
                     styled_groups.push(StyledGroup {
@@ -608,19 +652,21 @@ pub fn cmd_fill(args: &[String]) {
                         Boundary { points, color, stroke_width }
                     }).collect();
 
-                    grouped_chains_with_boundaries_to_svg(&styled_groups, &boundaries, &svg_content)
+                    write_output(output_path, quiet, |out| {
+                        grouped_chains_with_boundaries_to_svg(out, &styled_groups, &boundaries, &svg_content)
+                    });
                 } else {
-                    grouped_chains_to_svg(&styled_groups, &svg_content)
+                    write_output(output_path, quiet, |out| {
+                        grouped_chains_to_svg(out, &styled_groups, &svg_content)
+                    });
                 }
             } else {
                 // Simple mode: single pattern for all polygons
-                let mut all_lines: Vec<Line> = Vec::new();
-                for &idx in &order {
+                let all_lines: Vec<Line> = generate_parallel(&order, |idx| {
                     let polygon = &polygons[idx];
                     let lines = generate_pattern(pattern, polygon, spacing, angle);
-                    let lines = post_process(lines, polygon);
-                    all_lines.extend(lines);
-                }
+                    post_process(lines, polygon)
+                }).concat();
                 let all_lines = apply_sketchy(all_lines);
 
                 let elapsed = start.elapsed();
@@ -633,7 +679,7 @@ pub fn cmd_fill(args: &[String]) {
                             eprintln!("Applied sketchy effect");
                         }
                     }
-                    lines_to_svg(&all_lines, &svg_content)
+                    write_output(output_path, quiet, |out| lines_to_svg(out, &all_lines, &svg_content));
                 } else {
                     // Default: chain lines into polylines for smaller output
                     let chain_config_inner = ChainConfig::with_tolerance(chain_tolerance);
@@ -648,19 +694,37 @@ pub fn cmd_fill(args: &[String]) {
                         }
                     }
 
-                    chains_to_svg(&chains, &svg_content)
+                    write_output(output_path, quiet, |out| chains_to_svg(out, &chains, &svg_content));
                 }
             }
         }
-    };
+    }
+}
 
-    // Write output
+/// Stream generated output to `output_path`, or to stdout for `-` / none.
+///
+/// Output goes through a buffered writer straight to its destination, so
+/// large fills are never held in memory as one String. The file is only
+/// created once generation has finished, so a failed run leaves no partial
+/// output behind.
+fn write_output<F>(output_path: Option<&str>, quiet: bool, write: F)
+where
+    F: FnOnce(&mut dyn Write) -> io::Result<()>,
+{
     match output_path {
         Some("-") | None => {
-            println!("{}", output);
+            let mut out = BufWriter::new(io::stdout().lock());
+            write(&mut out)
+                .and_then(|()| writeln!(out))
+                .and_then(|()| out.flush())
+                .expect("Failed to write output");
         }
         Some(path) => {
-            fs::write(path, &output).expect("Failed to write output file");
+            let file = fs::File::create(path).expect("Failed to write output file");
+            let mut out = BufWriter::new(file);
+            write(&mut out)
+                .and_then(|()| out.flush())
+                .expect("Failed to write output file");
             if !quiet { eprintln!("Wrote: {}", path); }
         }
     }
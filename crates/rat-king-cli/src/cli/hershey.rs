@@ -6,6 +6,7 @@
 //! filled shapes.
 
 use std::collections::HashMap;
+use std::fmt::Write;
 use std::fs;
 use std::path::Path;
 
@@ -25,6 +26,9 @@ pub struct GlyphData {
     pub left: i8,
     /// Right bound (for advance width)
     pub right: i8,
+    /// The same commands as (command, x, y), parsed once at load so
+    /// rendering never re-parses `path`
+    commands: Vec<(char, i32, i32)>,
 }
 
 impl HersheyFont {
@@ -66,36 +70,10 @@ impl HersheyFont {
                 continue;
             }
 
-            // Find where the data starts (after the line number and spaces)
-            let data_start = trimmed.find(|c: char| c.is_ascii_digit())
-                .and_then(|_| {
-                    // Skip past the digits and spaces
-                    let mut chars = trimmed.chars().peekable();
-                    let mut pos = 0;
-                    while let Some(&c) = chars.peek() {
-                        if c.is_ascii_digit() {
-                            chars.next();
-                            pos += 1;
-                        } else {
-                            break;
-                        }
-                    }
-                    // Skip spaces
-                    while let Some(&c) = chars.peek() {
-                        if c == ' ' {
-                            chars.next();
-                            pos += 1;
-                        } else {
-                            break;
-                        }
-                    }
-                    Some(pos)
-                });
-
-            let data_start = match data_start {
-                Some(p) => p,
-                None => continue,
-            };
+            // Data starts after the line number and the spaces that follow it
+            let digits = trimmed.bytes().take_while(u8::is_ascii_digit).count();
+            let spaces = trimmed[digits..].bytes().take_while(|&b| b == b' ').count();
+            let data_start = digits + spaces;
 
             let data = &trimmed[data_start..];
             if data.len() < 3 {
@@ -114,17 +92,18 @@ impl HersheyFont {
             }
 
             // Next two characters are left/right bounds
-            let left = rest.chars().next().unwrap() as i8 - 'R' as i8;
-            let right = rest.chars().nth(1).unwrap() as i8 - 'R' as i8;
+            let left = rest.as_bytes()[0] as i8 - b'R' as i8;
+            let right = rest.as_bytes()[1] as i8 - b'R' as i8;
             let coords = &rest[2..];
 
-            // Parse coordinates into path
-            let path = parse_hershey_coords(coords);
+            // Parse coordinates into commands and path
+            let commands = parse_hershey_commands(coords);
+            let path = format_commands(&commands);
 
             // Glyph index + 31 = ASCII code (line 1 = space = ASCII 32)
             let char_code = (index as u8).wrapping_add(32);
 
-            glyphs.insert(char_code, GlyphData { path, left, right });
+            glyphs.insert(char_code, GlyphData { path, left, right, commands });
         }
 
         Ok(HersheyFont { glyphs })
@@ -152,7 +131,7 @@ impl HersheyFont {
             if let Some(glyph) = self.get_glyph(c) {
                 if !glyph.path.is_empty() {
                     // Transform the path to the correct position and scale
-                    let transformed = transform_path(&glyph.path, cursor_x, y, scale);
+                    let transformed = transform_path(&glyph.commands, cursor_x, y, scale);
                     paths.push(transformed);
                 }
                 // Advance cursor by glyph width
@@ -192,7 +171,7 @@ impl HersheyFont {
         for c in text.chars() {
             if let Some(glyph) = self.get_glyph(c) {
                 if !glyph.path.is_empty() {
-                    let transformed = transform_path_data(&glyph.path, cursor_x, y, scale);
+                    let transformed = transform_path_data(&glyph.commands, cursor_x, y, scale);
                     if !combined.is_empty() {
                         combined.push(' ');
                     }
@@ -209,90 +188,67 @@ impl HersheyFont {
     }
 }
 
-/// Parse Hershey coordinate pairs into SVG path data.
-fn parse_hershey_coords(coords: &str) -> String {
-    let mut commands = Vec::new();
+/// Parse Hershey coordinate pairs into (command, x, y) path commands.
+fn parse_hershey_commands(coords: &str) -> Vec<(char, i32, i32)> {
+    let mut commands = Vec::with_capacity(coords.len() / 2);
     let mut pen_up = true;
-    let chars: Vec<char> = coords.chars().collect();
-    let mut i = 0;
 
-    while i + 1 < chars.len() {
-        let c1 = chars[i];
-        let c2 = chars[i + 1];
+    // JHF data is ASCII, so scan it as byte pairs rather than collecting chars
+    for pair in coords.as_bytes().chunks_exact(2) {
+        let (c1, c2) = (pair[0], pair[1]);
 
         // ' R' means pen up (move to next stroke)
-        if c1 == ' ' && c2 == 'R' {
+        if c1 == b' ' && c2 == b'R' {
             pen_up = true;
-            i += 2;
             continue;
         }
 
         // Convert from Hershey coordinates (R = origin, ASCII 82)
-        let x = c1 as i32 - 'R' as i32;
-        let y = c2 as i32 - 'R' as i32;
+        let x = c1 as i32 - b'R' as i32;
+        let y = c2 as i32 - b'R' as i32;
 
-        if pen_up {
-            commands.push(format!("M {} {}", x, y));
-            pen_up = false;
-        } else {
-            commands.push(format!("L {} {}", x, y));
-        }
-
-        i += 2;
+        commands.push((if pen_up { 'M' } else { 'L' }, x, y));
+        pen_up = false;
     }
 
-    commands.join(" ")
+    commands
+}
+
+/// Format path commands as SVG path data in glyph units.
+fn format_commands(commands: &[(char, i32, i32)]) -> String {
+    // Each vertex becomes "M x y" / "L x y" appended straight onto one string,
+    // rather than a String per vertex that is joined afterwards
+    let mut path = String::with_capacity(commands.len() * 8);
+    for &(cmd, x, y) in commands {
+        if !path.is_empty() {
+            path.push(' ');
+        }
+        let _ = write!(path, "{} {} {}", cmd, x, y);
+    }
+    path
 }
 
-/// Transform path data to a new position and scale.
-fn transform_path(path: &str, x: f64, y: f64, scale: f64) -> String {
-    let data = transform_path_data(path, x, y, scale);
+/// Transform path commands to a new position and scale.
+fn transform_path(commands: &[(char, i32, i32)], x: f64, y: f64, scale: f64) -> String {
+    let data = transform_path_data(commands, x, y, scale);
     format!("<path d=\"{}\" />", data)
 }
 
 /// Transform just the path data (d attribute content).
-fn transform_path_data(path: &str, x: f64, y: f64, scale: f64) -> String {
-    let mut result = String::new();
-
-    for part in path.split_whitespace() {
-        if part.starts_with('M') || part.starts_with('L') {
-            result.push_str(part);
-            result.push(' ');
-        } else if let Ok(val) = part.parse::<f64>() {
-            // Check if this is an X or Y coordinate by counting previous numbers
-            let num_count = result.matches(char::is_numeric).count()
-                + result.matches('-').count()
-                + result.matches('.').count();
-
-            // Simple heuristic: odd position = X, even = Y
-            // Actually, we need to track M/L commands properly
-            result.push_str(&format!("{:.2} ", val));
-        } else {
-            result.push_str(part);
-            result.push(' ');
-        }
-    }
+fn transform_path_data(commands: &[(char, i32, i32)], x: f64, y: f64, scale: f64) -> String {
+    // Write each command's transformed pair straight into one output string
+    let mut transformed = String::with_capacity(commands.len() * 16);
 
-    // Parse and transform properly
-    let mut transformed = String::new();
-    let tokens: Vec<&str> = path.split_whitespace().collect();
-    let mut i = 0;
-
-    while i < tokens.len() {
-        let cmd = tokens[i];
-        if (cmd == "M" || cmd == "L") && i + 2 < tokens.len() {
-            let px: f64 = tokens[i + 1].parse().unwrap_or(0.0);
-            let py: f64 = tokens[i + 2].parse().unwrap_or(0.0);
-            let tx = x + px * scale;
-            let ty = y + py * scale;
-            transformed.push_str(&format!("{} {:.2} {:.2} ", cmd, tx, ty));
-            i += 3;
-        } else {
-            i += 1;
+    for &(cmd, px, py) in commands {
+        if !transformed.is_empty() {
+            transformed.push(' ');
         }
+        let tx = x + px as f64 * scale;
+        let ty = y + py as f64 * scale;
+        let _ = write!(transformed, "{} {:.2} {:.2}", cmd, tx, ty);
     }
 
-    transformed.trim().to_string()
+    transformed
 }
 
 #[cfg(test)]
@@ -303,9 +259,21 @@ mod tests {
     fn test_parse_coords() {
         // Simple test with known coordinates
         let coords = "RFRT"; // Two points: R,F and R,T
-        let path = parse_hershey_coords(coords);
+        let path = format_commands(&parse_hershey_commands(coords));
         assert!(path.contains("M "));
         assert!(path.contains("L "));
+        assert_eq!(path, "M 0 -12 L 0 2");
+
+        // " R" lifts the pen, so the next vertex starts a new stroke
+        let commands = parse_hershey_commands("RFRT RRRRS");
+        assert_eq!(commands, vec![('M', 0, -12), ('L', 0, 2), ('M', 0, 0), ('L', 0, 1)]);
+        assert_eq!(format_commands(&commands), "M 0 -12 L 0 2 M 0 0 L 0 1");
+    }
+
+    #[test]
+    fn test_transform_path_data() {
+        let data = transform_path_data(&[('M', 1, 2), ('L', 3, -4)], 10.0, 20.0, 2.0);
+        assert_eq!(data, "M 12.00 24.00 L 16.00 12.00");
     }
 
     #[test]
@@ -29,29 +29,92 @@ pub fn point_in_polygon(px: f64, py: f64, polygon: &[Point]) -> bool {
     }
 
     let mut inside = false;
-    let mut j = n - 1;
+    let mut prev = polygon[n - 1];
 
     // ## Rust Lesson #9: Iterators vs Indexing
     //
-    // We could use `for i in 0..n` (range iterator)
-    // But here we need both current and previous vertex.
-    // Classic loop with indices is fine for this.
+    // We need both current and previous vertex. Indexing `polygon[i]`
+    // costs a bounds check per access; iterating the slice and carrying
+    // the previous vertex along lets the compiler drop them entirely.
 
-    for i in 0..n {
-        let (xi, yi) = (polygon[i].x, polygon[i].y);
-        let (xj, yj) = (polygon[j].x, polygon[j].y);
+    for &cur in polygon {
+        let (xi, yi) = (cur.x, cur.y);
+        let (xj, yj) = (prev.x, prev.y);
 
         // Ray casting: check if horizontal ray from (px, py) crosses this edge
         if ((yi > py) != (yj > py)) && (px < (xj - xi) * (py - yi) / (yj - yi) + xi) {
             inside = !inside;
         }
 
-        j = i;
+        prev = cur;
     }
 
     inside
 }
 
+/// Test many points against the same polygon in one sweep.
+///
+/// The same ray-casting rule as `point_in_polygon`, but edge-major: each
+/// edge is loaded once and its slope `(xj - xi) / (yj - yi)` computed once,
+/// then every point is tested against it. That moves the division out of
+/// the inner loop and leaves a tight, vectorizable loop over points.
+///
+/// `slope * (py - yi)` rounds differently from the scalar
+/// `(xj - xi) * (py - yi) / (yj - yi)`, so the two agree up to rounding:
+/// a point lying on an edge may be classified differently.
+pub fn points_in_polygon(points: &[Point], polygon: &[Point]) -> Vec<bool> {
+    let mut inside = vec![false; points.len()];
+    if polygon.len() >= 3 {
+        toggle_crossings(points, polygon, &mut inside);
+    }
+    inside
+}
+
+/// Points tested per sweep by `all_points_in_polygon`.
+const ALL_INSIDE_BLOCK: usize = 8;
+
+/// Test whether every point is inside the polygon.
+///
+/// Same classification as `points_in_polygon`, but sweeps the points a
+/// small block at a time and stops at the first block with a point
+/// outside, so a rejection costs about one block instead of every point.
+pub fn all_points_in_polygon(points: &[Point], polygon: &[Point]) -> bool {
+    if polygon.len() < 3 {
+        return points.is_empty();
+    }
+
+    let mut inside = [false; ALL_INSIDE_BLOCK];
+    points.chunks(ALL_INSIDE_BLOCK).all(|block| {
+        let inside = &mut inside[..block.len()];
+        inside.fill(false);
+        toggle_crossings(block, polygon, inside);
+        inside.iter().all(|&flag| flag)
+    })
+}
+
+/// Flip `inside[k]` for every polygon edge the rightward ray from
+/// `points[k]` crosses. `polygon` must have at least 3 vertices.
+fn toggle_crossings(points: &[Point], polygon: &[Point], inside: &mut [bool]) {
+    let mut prev = polygon[polygon.len() - 1];
+    for &cur in polygon {
+        let (xi, yi) = (cur.x, cur.y);
+        let (xj, yj) = (prev.x, prev.y);
+        prev = cur;
+
+        // Horizontal edges never cross a horizontal ray
+        if yi == yj {
+            continue;
+        }
+        let slope = (xj - xi) / (yj - yi);
+
+        for (p, flag) in points.iter().zip(inside.iter_mut()) {
+            if ((yi > p.y) != (yj > p.y)) && (p.x < slope * (p.y - yi) + xi) {
+                *flag = !*flag;
+            }
+        }
+    }
+}
+
 // ============================================================================
 // LINE-LINE INTERSECTION
 // ============================================================================
@@ -93,17 +156,24 @@ pub fn line_segment_intersection(
         return Intersection::None;
     }
 
-    let ua = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) / denom;
-    let ub = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) / denom;
-
-    // Check if intersection is within both segments
-    if (0.0..=1.0).contains(&ua) && (0.0..=1.0).contains(&ub) {
-        let ix = x1 + ua * (x2 - x1);
-        let iy = y1 + ua * (y2 - y1);
-        Intersection::Point { x: ix, y: iy, t: ua }
-    } else {
-        Intersection::None
+    // Fold the sign of `denom` into the numerators so the range checks
+    // 0 <= ua, ub <= 1 need no division. Most edges miss, so only hits
+    // pay for the divide.
+    let sign = denom.signum();
+    let na = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) * sign;
+    let nb = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) * sign;
+    let d = denom.abs();
+
+    // Check if intersection is within both segments (non-short-circuit `&`).
+    // Written in positive form so a NaN coordinate fails it and misses.
+    if !((na >= 0.0) & (na <= d) & (nb >= 0.0) & (nb <= d)) {
+        return Intersection::None;
     }
+
+    let ua = na / d;
+    let ix = x1 + ua * (x2 - x1);
+    let iy = y1 + ua * (y2 - y1);
+    Intersection::Point { x: ix, y: iy, t: ua }
 }
 
 // ============================================================================
@@ -130,9 +200,6 @@ pub fn line_polygon_intersections(
 
     let mut intersections = Vec::with_capacity(n / 2);
 
-    let dx = lx2 - lx1;
-    let dy = ly2 - ly1;
-
     for i in 0..n {
         let j = (i + 1) % n;
         let (x3, y3) = (polygon[i].x, polygon[i].y);
@@ -145,18 +212,11 @@ pub fn line_polygon_intersections(
         //
         // Full version: match result { Point{x,y,t} => ..., None => ... }
 
-        if let Intersection::Point { x, y, t: _ } = line_segment_intersection(
+        if let Intersection::Point { x, y, t } = line_segment_intersection(
             lx1, ly1, lx2, ly2,
             x3, y3, x4, y4,
         ) {
-            // Calculate t parameter for sorting
-            let t = if dx.abs() > dy.abs() {
-                (x - lx1) / dx
-            } else if dy != 0.0 {
-                (y - ly1) / dy
-            } else {
-                0.0
-            };
+            // `t` is already the parameter along the line - use it for sorting
             intersections.push((x, y, t));
         }
     }
@@ -171,17 +231,30 @@ pub fn line_polygon_intersections(
 ///
 /// Returns a list of line segments that lie inside the polygon.
 pub fn clip_line_to_polygon(line: Line, polygon: &Polygon) -> Vec<Line> {
-    // Fast bounding box rejection
-    if let Some((min_x, min_y, max_x, max_y)) = polygon.bounding_box() {
-        let line_min_x = line.x1.min(line.x2);
-        let line_max_x = line.x1.max(line.x2);
-        let line_min_y = line.y1.min(line.y2);
-        let line_max_y = line.y1.max(line.y2);
-
-        if line_max_x < min_x || line_min_x > max_x ||
-           line_max_y < min_y || line_min_y > max_y {
-            return Vec::new();
-        }
+    let Some(bounds) = polygon.bounding_box() else {
+        return Vec::new();
+    };
+    clip_line_in_bounds(line, polygon, bounds)
+}
+
+/// Clip a line to a polygon whose bounding box is already known.
+///
+/// Batch callers compute the bounding box once per polygon instead of
+/// once per line.
+fn clip_line_in_bounds(
+    line: Line,
+    polygon: &Polygon,
+    (min_x, min_y, max_x, max_y): (f64, f64, f64, f64),
+) -> Vec<Line> {
+    // Fast bounding box rejection: 4 comparisons instead of an O(n) edge walk
+    let line_min_x = line.x1.min(line.x2);
+    let line_max_x = line.x1.max(line.x2);
+    let line_min_y = line.y1.min(line.y2);
+    let line_max_y = line.y1.max(line.y2);
+
+    if line_max_x < min_x || line_min_x > max_x ||
+       line_max_y < min_y || line_min_y > max_y {
+        return Vec::new();
     }
 
     let p1_inside = point_in_polygon(line.x1, line.y1, &polygon.outer);
@@ -281,8 +354,20 @@ fn clip_line_multiple_intersections(
 ///
 /// Lines inside holes are excluded.
 pub fn clip_line_to_polygon_with_holes(line: Line, polygon: &Polygon) -> Vec<Line> {
+    let Some(bounds) = polygon.bounding_box() else {
+        return Vec::new();
+    };
+    clip_line_with_holes_in_bounds(line, polygon, bounds)
+}
+
+/// Clip a line to a polygon with holes, given its precomputed bounding box.
+fn clip_line_with_holes_in_bounds(
+    line: Line,
+    polygon: &Polygon,
+    bounds: (f64, f64, f64, f64),
+) -> Vec<Line> {
     // First clip to outer boundary
-    let mut segments = clip_line_to_polygon(line, polygon);
+    let mut segments = clip_line_in_bounds(line, polygon, bounds);
 
     // Then exclude segments inside any hole
     for hole in &polygon.holes {
@@ -319,10 +404,28 @@ pub fn clip_lines_to_polygon(lines: &[Line], polygon: &Polygon) -> Vec<Line> {
     //
     // This is LAZY - nothing happens until .collect().
     // Zero intermediate allocations!
+    //
+    // The bounding box is computed once here and shared by every line.
+
+    let Some(bounds) = polygon.bounding_box() else {
+        return Vec::new();
+    };
+
+    clip_lines_in_bounds(lines, polygon, bounds)
+}
 
+/// Clip multiple lines to a polygon whose bounding box is already known.
+///
+/// Pattern generators compute the bounding box for their own layout;
+/// passing it through here saves walking the outline again.
+pub fn clip_lines_in_bounds(
+    lines: &[Line],
+    polygon: &Polygon,
+    bounds: (f64, f64, f64, f64),
+) -> Vec<Line> {
     lines
         .iter()
-        .flat_map(|line| clip_line_to_polygon_with_holes(*line, polygon))
+        .flat_map(|line| clip_line_with_holes_in_bounds(*line, polygon, bounds))
         .collect()
 }
 
@@ -351,6 +454,48 @@ mod tests {
         assert!(!point_in_polygon(-1.0, 5.0, &sq.outer));
     }
 
+    #[test]
+    fn batch_matches_scalar_point_in_polygon() {
+        // Concave "L" shape
+        let poly = vec![
+            Point::new(0.0, 0.0),
+            Point::new(10.0, 0.0),
+            Point::new(10.0, 4.0),
+            Point::new(4.0, 4.0),
+            Point::new(4.0, 10.0),
+            Point::new(0.0, 10.0),
+        ];
+        let points: Vec<Point> = (0..12)
+            .flat_map(|i| (0..12).map(move |j| Point::new(i as f64 - 0.5, j as f64 - 0.5)))
+            .collect();
+
+        let batch = points_in_polygon(&points, &poly);
+        for (p, &inside) in points.iter().zip(&batch) {
+            assert_eq!(inside, point_in_polygon(p.x, p.y, &poly), "mismatch at {:?}", p);
+        }
+    }
+
+    #[test]
+    fn all_points_in_polygon_stops_at_any_outside_point() {
+        let sq = square();
+        // Spans several blocks, all strictly inside
+        let mut points: Vec<Point> = (0..20)
+            .map(|i| Point::new(1.0 + i as f64 * 0.4, 5.0))
+            .collect();
+        assert!(all_points_in_polygon(&points, &sq.outer));
+
+        // One outside point fails it wherever it falls, including the last partial block
+        for k in [0, 7, 8, 19] {
+            let saved = points[k];
+            points[k] = Point::new(15.0, 5.0);
+            assert!(!all_points_in_polygon(&points, &sq.outer), "outside point at {}", k);
+            points[k] = saved;
+        }
+
+        assert!(all_points_in_polygon(&[], &sq.outer));
+        assert!(!all_points_in_polygon(&points, &sq.outer[..2]));
+    }
+
     #[test]
     fn line_entirely_inside() {
         let sq = square();
@@ -368,6 +513,20 @@ mod tests {
         assert!(result.is_empty());
     }
 
+    #[test]
+    fn nan_line_clips_to_nothing() {
+        // NaN spacing/angle from user input must give empty output, not a
+        // NaN hit whose sort key panics
+        let sq = square();
+        let line = Line::new(f64::NAN, 5.0, 15.0, f64::NAN);
+        assert!(clip_line_to_polygon(line, &sq).is_empty());
+        assert!(clip_lines_to_polygon(&[line], &sq).is_empty());
+        assert!(matches!(
+            line_segment_intersection(f64::NAN, 0.0, 10.0, 10.0, 0.0, 10.0, 10.0, 0.0),
+            Intersection::None
+        ));
+    }
+
     #[test]
     fn line_crosses_polygon() {
         let sq = square();
@@ -399,5 +558,24 @@ mod tests {
             0.0, 5.0, 10.0, 5.0,
         );
         assert!(matches!(result, Intersection::None));
+
+        // Would cross only if the second segment were extended
+        let result = line_segment_intersection(
+            0.0, 0.0, 10.0, 10.0,
+            0.0, 10.0, 4.0, 6.0,
+        );
+        assert!(matches!(result, Intersection::None));
+
+        // Reversed second segment (negative denominator) gives the same hit
+        let result = line_segment_intersection(
+            0.0, 0.0, 10.0, 10.0,
+            10.0, 0.0, 0.0, 10.0,
+        );
+        if let Intersection::Point { x, t, .. } = result {
+            assert!((x - 5.0).abs() < 1e-10);
+            assert!((t - 0.5).abs() < 1e-10);
+        } else {
+            panic!("Expected intersection");
+        }
     }
 }
@@ -14,7 +14,11 @@
 /// A 2D point with x,y coordinates.
 ///
 /// `f64` = 64-bit float (like JS's `number` but explicitly sized)
+///
+/// `#[repr(C)]` pins the field order, so a `Vec<Point>` is one flat
+/// `[x0, y0, x1, y1, ...]` buffer of f64 - no boxing, no pointers.
 #[derive(Debug, Clone, Copy, PartialEq)]
+#[repr(C)]
 pub struct Point {
     pub x: f64,
     pub y: f64,
@@ -22,6 +26,7 @@ pub struct Point {
 
 /// A line segment defined by two endpoints.
 #[derive(Debug, Clone, Copy, PartialEq)]
+#[repr(C)]
 pub struct Line {
     pub x1: f64,
     pub y1: f64,
@@ -97,6 +102,16 @@ impl Point {
         let dy = self.y - other.y;
         (dx * dx + dy * dy).sqrt()
     }
+
+    /// Squared distance to another point.
+    ///
+    /// Skips the sqrt - use this when only comparing distances.
+    #[inline]
+    pub fn distance_squared(&self, other: Point) -> f64 {
+        let dx = self.x - other.x;
+        let dy = self.y - other.y;
+        dx * dx + dy * dy
+    }
 }
 
 impl Line {
@@ -237,14 +252,17 @@ impl Polygon {
             return None; // Early return, like JS
         }
 
-        // Iterators! Like JS's .map().filter().reduce() but zero-cost.
-        // The compiler turns this into a simple loop.
-        let min_x = self.outer.iter().map(|p| p.x).fold(f64::INFINITY, f64::min);
-        let min_y = self.outer.iter().map(|p| p.y).fold(f64::INFINITY, f64::min);
-        let max_x = self.outer.iter().map(|p| p.x).fold(f64::NEG_INFINITY, f64::max);
-        let max_y = self.outer.iter().map(|p| p.y).fold(f64::NEG_INFINITY, f64::max);
-
-        Some((min_x, min_y, max_x, max_y))
+        // Iterators! Like JS's .reduce() but zero-cost.
+        // A single fold carries all four extremes, so the points are
+        // walked once instead of once per axis bound.
+        let bounds = self.outer.iter().fold(
+            (f64::INFINITY, f64::INFINITY, f64::NEG_INFINITY, f64::NEG_INFINITY),
+            |(min_x, min_y, max_x, max_y), p| {
+                (min_x.min(p.x), min_y.min(p.y), max_x.max(p.x), max_y.max(p.y))
+            },
+        );
+
+        Some(bounds)
     }
 
     /// Check if a point is inside the polygon body (inside outer, not in any hole).
@@ -331,11 +349,13 @@ pub fn signed_area_of_points(points: &[Point]) -> f64 {
         return 0.0;
     }
 
+    // Carry the previous vertex instead of indexing with `(i + 1) % n`:
+    // no integer division or bounds check per vertex.
     let mut area = 0.0;
-    for i in 0..n {
-        let j = (i + 1) % n;
-        area += points[i].x * points[j].y;
-        area -= points[j].x * points[i].y;
+    let mut prev = points[n - 1];
+    for &p in points {
+        area += prev.x * p.y - p.x * prev.y;
+        prev = p;
     }
     area / 2.0
 }
@@ -356,6 +376,14 @@ mod tests {
         let p1 = Point::new(0.0, 0.0);
         let p2 = Point::new(3.0, 4.0);
         assert_eq!(p1.distance(p2), 5.0); // 3-4-5 triangle
+        assert_eq!(p1.distance_squared(p2), 25.0);
+    }
+
+    #[test]
+    fn point_layout_is_packed() {
+        // Vec<Point> must be a flat run of (x, y) f64 pairs
+        assert_eq!(std::mem::size_of::<Point>(), 2 * std::mem::size_of::<f64>());
+        assert_eq!(std::mem::size_of::<Line>(), 4 * std::mem::size_of::<f64>());
     }
 
     #[test]
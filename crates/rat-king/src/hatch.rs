@@ -9,7 +9,7 @@ use crate::geometry::{Line, Polygon};
 // Re-import Point only for tests
 #[cfg(test)]
 use crate::geometry::Point;
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 
 /// Generate parallel hatch lines covering a polygon's bounding box.
 ///
@@ -24,7 +24,7 @@ pub fn generate_hatch_lines(
     spacing: f64,
     angle_degrees: f64,
 ) -> Vec<Line> {
-    let Some((min_x, min_y, max_x, max_y)) = polygon.bounding_box() else {
+    let Some(bounds) = polygon.bounding_box() else {
         // ## Rust Lesson #18: let-else
         //
         // `let Some(x) = expr else { return }` is a clean way to
@@ -33,19 +33,30 @@ pub fn generate_hatch_lines(
         return Vec::new();
     };
 
+    hatch_lines_in_bounds(bounds, spacing, angle_degrees)
+}
+
+/// Generate hatch lines covering an already-computed bounding box.
+fn hatch_lines_in_bounds(
+    (min_x, min_y, max_x, max_y): (f64, f64, f64, f64),
+    spacing: f64,
+    angle_degrees: f64,
+) -> Vec<Line> {
     let width = max_x - min_x;
     let height = max_y - min_y;
     let angle_rad = angle_degrees * PI / 180.0;
 
-    // Diagonal covers rotated bbox (sqrt(2) ≈ 1.42)
-    let diagonal = (width * width + height * height).sqrt() * 1.42;
-
     // Direction vectors
     let perp_x = (angle_rad + PI / 2.0).cos();
     let perp_y = (angle_rad + PI / 2.0).sin();
     let dir_x = angle_rad.cos();
     let dir_y = angle_rad.sin();
 
+    // Project the bbox onto each direction rather than using its diagonal:
+    // across = spread of line offsets, along = how far each line must reach.
+    let half_across = (width * perp_x.abs() + height * perp_y.abs()) / 2.0;
+    let half_along = (width * dir_x.abs() + height * dir_y.abs()) / 2.0 + spacing;
+
     // Center of bounding box
     let center_x = min_x + width / 2.0;
     let center_y = min_y + height / 2.0;
@@ -54,7 +65,7 @@ pub fn generate_hatch_lines(
     //
     // `.ceil()` returns f64, we need to cast to integer.
     // `as i32` is explicit type coercion (no implicit conversions!)
-    let num_lines = (diagonal / spacing).ceil() as i32 + 1;
+    let num_lines = (half_across / spacing).ceil() as i32 + 1;
 
     let mut lines = Vec::with_capacity((num_lines * 2 + 1) as usize);
 
@@ -64,10 +75,10 @@ pub fn generate_hatch_lines(
         let line_center_y = center_y + perp_y * offset;
 
         lines.push(Line::new(
-            line_center_x - dir_x * diagonal,
-            line_center_y - dir_y * diagonal,
-            line_center_x + dir_x * diagonal,
-            line_center_y + dir_y * diagonal,
+            line_center_x - dir_x * half_along,
+            line_center_y - dir_y * half_along,
+            line_center_x + dir_x * half_along,
+            line_center_y + dir_y * half_along,
         ));
     }
 
@@ -82,8 +93,21 @@ pub fn generate_lines_fill(
     spacing: f64,
     angle_degrees: f64,
 ) -> Vec<Line> {
-    let hatch_lines = generate_hatch_lines(polygon, spacing, angle_degrees);
-    clip_lines_to_polygon(&hatch_lines, polygon)
+    let Some(bounds) = polygon.bounding_box() else {
+        return Vec::new();
+    };
+    lines_fill_in_bounds(polygon, bounds, spacing, angle_degrees)
+}
+
+/// Generate and clip hatch lines, sharing one bounding box between both steps.
+fn lines_fill_in_bounds(
+    polygon: &Polygon,
+    bounds: (f64, f64, f64, f64),
+    spacing: f64,
+    angle_degrees: f64,
+) -> Vec<Line> {
+    let hatch_lines = hatch_lines_in_bounds(bounds, spacing, angle_degrees);
+    clip_lines_in_bounds(&hatch_lines, polygon, bounds)
 }
 
 /// Generate crosshatch pattern (two sets of perpendicular lines).
@@ -92,8 +116,11 @@ pub fn generate_crosshatch_fill(
     spacing: f64,
     angle_degrees: f64,
 ) -> Vec<Line> {
-    let mut lines = generate_lines_fill(polygon, spacing, angle_degrees);
-    let perpendicular = generate_lines_fill(polygon, spacing, angle_degrees + 90.0);
+    let Some(bounds) = polygon.bounding_box() else {
+        return Vec::new();
+    };
+    let mut lines = lines_fill_in_bounds(polygon, bounds, spacing, angle_degrees);
+    let perpendicular = lines_fill_in_bounds(polygon, bounds, spacing, angle_degrees + 90.0);
     lines.extend(perpendicular);
     lines
 }
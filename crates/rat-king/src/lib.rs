@@ -23,7 +23,7 @@ pub mod svg;
 
 // Re-export common types at crate root for convenience.
 pub use chain::{chain_lines, Chain, ChainConfig, ChainStats};
-pub use clip::{clip_line_to_polygon, clip_lines_to_polygon, point_in_polygon};
+pub use clip::{all_points_in_polygon, clip_line_to_polygon, clip_lines_to_polygon, point_in_polygon, points_in_polygon};
 pub use geometry::{Line, Point, Polygon};
 pub use hatch::{generate_crosshatch_fill, generate_hatch_lines, generate_lines_fill};
 pub use order::{order_polygons, order_nearest_neighbor, calculate_travel_distance, OrderingStrategy};
@@ -47,8 +47,8 @@ pub fn order_nearest_neighbor(polygons: &[Polygon]) -> Vec<usize> {
     // Start from polygon nearest to origin
     let first = remaining.iter()
         .min_by(|&&a, &&b| {
-            let dist_a = centroids[a].x.powi(2) + centroids[a].y.powi(2);
-            let dist_b = centroids[b].x.powi(2) + centroids[b].y.powi(2);
+            let dist_a = centroids[a].x * centroids[a].x + centroids[a].y * centroids[a].y;
+            let dist_b = centroids[b].x * centroids[b].x + centroids[b].y * centroids[b].y;
             dist_a.partial_cmp(&dist_b).unwrap()
         })
         .copied()
@@ -64,8 +64,8 @@ pub fn order_nearest_neighbor(polygons: &[Polygon]) -> Vec<usize> {
 
         let nearest = remaining.iter()
             .min_by(|&&a, &&b| {
-                let dist_a = current_centroid.distance(centroids[a]);
-                let dist_b = current_centroid.distance(centroids[b]);
+                let dist_a = current_centroid.distance_squared(centroids[a]);
+                let dist_b = current_centroid.distance_squared(centroids[b]);
                 dist_a.partial_cmp(&dist_b).unwrap()
             })
             .copied()
@@ -4,7 +4,6 @@
 //! Classic masonry pattern used in walls and pavements.
 
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
 use super::util::PatternContext;
 
 /// Generate brick pattern fill for a polygon.
@@ -69,7 +68,7 @@ pub fn generate_brick_fill(
     }
 
     // Clip all lines to polygon (for horizontal lines extending outside)
-    clip_lines_to_polygon(&lines, polygon)
+    ctx.clip_lines(&lines)
 }
 
 #[cfg(test)]
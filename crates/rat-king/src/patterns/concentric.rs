@@ -1,6 +1,6 @@
 //! Concentric fill pattern - polygon offset rings.
 
-use crate::geometry::{Line, Point, Polygon};
+use crate::geometry::{signed_area_of_points, Line, Point, Polygon};
 
 /// Generate concentric fill lines (rings from outside in).
 ///
@@ -25,21 +25,22 @@ pub fn generate_concentric_fill(
 
     let mut loops: Vec<Vec<Point>> = Vec::new();
     let mut current_polygon = outer.clone();
+    // Only the outline's area is computed here; each inset reports its own
+    let mut current_area = signed_area_of_points(&current_polygon).abs();
 
     for _ in 0..max_loops {
         if current_polygon.len() < 3 {
             break;
         }
 
-        let area = polygon_area(&current_polygon).abs();
-        if area < min_area {
+        if current_area < min_area {
             break;
         }
 
-        loops.push(current_polygon.clone());
-
-        // Inset the polygon
-        current_polygon = inset_polygon(&current_polygon, spacing);
+        // Inset the polygon, moving the current ring into `loops` (no clone)
+        let (next_polygon, next_area) = inset_polygon(&current_polygon, spacing);
+        loops.push(std::mem::replace(&mut current_polygon, next_polygon));
+        current_area = next_area.abs();
 
         if current_polygon.len() < 3 {
             break;
@@ -51,30 +52,30 @@ pub fn generate_concentric_fill(
         loops.push(outer.clone());
     }
 
-    let mut lines = Vec::new();
+    // Exact output size is known up front: one segment per ring vertex
+    // plus at most one connector per ring.
+    let num_segments: usize = loops.iter().map(Vec::len).sum();
+    let mut lines = Vec::with_capacity(num_segments + loops.len());
 
     for (loop_idx, loop_points) in loops.iter().enumerate() {
-        // Draw the loop as connected line segments
-        for i in 0..loop_points.len() {
-            let j = (i + 1) % loop_points.len();
-            lines.push(Line::new(
-                loop_points[i].x, loop_points[i].y,
-                loop_points[j].x, loop_points[j].y,
-            ));
-        }
+        // Draw the loop as connected line segments (last vertex wraps to first)
+        let next_points = loop_points.iter().cycle().skip(1);
+        lines.extend(loop_points.iter().zip(next_points).map(|(a, b)| {
+            Line::new(a.x, a.y, b.x, b.y)
+        }));
 
         // Connect to next loop
         if connect_loops && loop_idx < loops.len() - 1 {
             let next_loop = &loops[loop_idx + 1];
             if let Some(last_point) = loop_points.last() {
-                // Find closest point on next loop
-                let closest = next_loop
-                    .iter()
-                    .min_by(|a, b| {
-                        let da = (a.x - last_point.x).powi(2) + (a.y - last_point.y).powi(2);
-                        let db = (b.x - last_point.x).powi(2) + (b.y - last_point.y).powi(2);
-                        da.partial_cmp(&db).unwrap()
-                    });
+                // Find closest point on next loop, one squared distance per vertex
+                let (_, closest) = next_loop.iter().fold(
+                    (f64::INFINITY, None),
+                    |(best, found), p| {
+                        let d = p.distance_squared(*last_point);
+                        if d < best { (d, Some(p)) } else { (best, found) }
+                    },
+                );
 
                 if let Some(closest_point) = closest {
                     lines.push(Line::new(
@@ -89,70 +90,89 @@ pub fn generate_concentric_fill(
     lines
 }
 
-/// Calculate signed area of a polygon (shoelace formula).
-fn polygon_area(points: &[Point]) -> f64 {
-    let n = points.len();
-    if n < 3 {
-        return 0.0;
-    }
-
-    let mut area = 0.0;
-    for i in 0..n {
-        let j = (i + 1) % n;
-        area += points[i].x * points[j].y;
-        area -= points[j].x * points[i].y;
-    }
-    area / 2.0
-}
-
 /// Simple centroid-based polygon inset.
 ///
 /// Moves each vertex toward the centroid by the inset distance.
-fn inset_polygon(points: &[Point], inset: f64) -> Vec<Point> {
-    if points.len() < 3 {
-        return Vec::new();
+/// Returns the inset ring together with its signed area. Building the
+/// ring, dropping collapsed duplicates and summing the shoelace area all
+/// happen in one pass over the vertices, with no intermediate buffer.
+///
+/// Moving every vertex a fixed distance along its ray from the centroid
+/// never reverses an individual edge (the new and old edge vectors have a
+/// non-negative dot product). That is a per-edge property only: when the
+/// polygon is not star-shaped about its centroid, non-adjacent edges can
+/// still cross and the inset ring may self-intersect.
+fn inset_polygon(points: &[Point], inset: f64) -> (Vec<Point>, f64) {
+    let n = points.len();
+    if n < 3 {
+        return (Vec::new(), 0.0);
     }
 
-    // Calculate centroid
-    let centroid_x = points.iter().map(|p| p.x).sum::<f64>() / points.len() as f64;
-    let centroid_y = points.iter().map(|p| p.y).sum::<f64>() / points.len() as f64;
+    // Calculate centroid (both coordinates summed in one pass)
+    let (sum_x, sum_y) = points
+        .iter()
+        .fold((0.0, 0.0), |(sx, sy), p| (sx + p.x, sy + p.y));
+    let centroid_x = sum_x / n as f64;
+    let centroid_y = sum_y / n as f64;
 
-    let mut result = Vec::with_capacity(points.len());
+    let mut ring: Vec<Point> = Vec::with_capacity(n);
+    let mut twice_area = 0.0;
+    let inset_sq = inset * inset;
 
     for p in points {
         let dx = p.x - centroid_x;
         let dy = p.y - centroid_y;
-        let dist = (dx * dx + dy * dy).sqrt();
+        let dist_sq = dx * dx + dy * dy;
 
-        if dist < inset {
+        // Collapse test on squared distance, so collapsing vertices skip
+        // the sqrt entirely
+        let q = if dist_sq < inset_sq {
             // Point collapses to centroid
-            result.push(Point::new(centroid_x, centroid_y));
+            Point::new(centroid_x, centroid_y)
         } else {
-            let scale = (dist - inset) / dist;
-            result.push(Point::new(
-                centroid_x + dx * scale,
-                centroid_y + dy * scale,
-            ));
+            let scale = 1.0 - inset / dist_sq.sqrt();
+            Point::new(centroid_x + dx * scale, centroid_y + dy * scale)
+        };
+
+        // Skip duplicate points that collapsed, summing the shoelace
+        // terms of the edges that survive
+        match ring.last() {
+            Some(last) if (last.x - q.x).abs() > 0.001 || (last.y - q.y).abs() > 0.001 => {
+                twice_area += last.x * q.y - q.x * last.y;
+                ring.push(q);
+            }
+            Some(_) => {}
+            None => ring.push(q),
         }
     }
 
-    // Remove duplicate points that collapsed
-    let mut deduped = Vec::new();
-    for p in result {
-        if deduped.is_empty() || deduped.last().map_or(true, |last: &Point| {
-            (last.x - p.x).abs() > 0.001 || (last.y - p.y).abs() > 0.001
-        }) {
-            deduped.push(p);
-        }
+    if ring.len() < 3 {
+        return (ring, 0.0);
     }
 
-    deduped
+    // Closing edge (last -> first)
+    let (first, last) = (ring[0], ring[ring.len() - 1]);
+    twice_area += last.x * first.y - first.x * last.y;
+
+    (ring, twice_area / 2.0)
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn inset_reports_signed_area() {
+        let square = vec![
+            Point::new(0.0, 0.0),
+            Point::new(100.0, 0.0),
+            Point::new(100.0, 100.0),
+            Point::new(0.0, 100.0),
+        ];
+        let (ring, area) = inset_polygon(&square, 10.0);
+        assert!((area - signed_area_of_points(&ring)).abs() < 1e-9);
+    }
+
     #[test]
     fn generates_concentric_lines() {
         let poly = Polygon::new(vec![
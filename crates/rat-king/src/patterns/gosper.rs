@@ -6,7 +6,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 
 /// Generate Gosper curve fill for a polygon.
 ///
@@ -82,7 +82,7 @@ pub fn generate_gosper_fill(
     }
 
     // Clip to polygon
-    clip_lines_to_polygon(&all_lines, polygon)
+    clip_lines_in_bounds(&all_lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 /// Generate Gosper curve points using L-system.
@@ -9,7 +9,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 
 /// Evaluate the gyroid function at a point.
 /// Returns a scalar field value - the zero-contour is the gyroid surface.
@@ -60,7 +60,7 @@ pub fn generate_gyroid_fill(
     }
 
     // Clip all lines to polygon boundary
-    clip_lines_to_polygon(&lines, polygon)
+    clip_lines_in_bounds(&lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 /// Generate contour lines for a single z-slice of the gyroid.
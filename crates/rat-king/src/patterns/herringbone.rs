@@ -5,7 +5,6 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
 use super::util::{PatternContext, RotationTransform};
 
 /// Generate herringbone fill pattern for a polygon.
@@ -62,7 +61,7 @@ pub fn generate_herringbone_fill(
     let rot = RotationTransform::new(ctx.center.x, ctx.center.y, ctx.angle_rad);
     let rotated_lines: Vec<Line> = lines.iter().map(|line| rot.apply_line(line)).collect();
 
-    clip_lines_to_polygon(&rotated_lines, polygon)
+    ctx.clip_lines(&rotated_lines)
 }
 
 #[cfg(test)]
@@ -100,8 +100,9 @@ pub fn generate_phyllotaxis_fill(
                 });
                 if !in_hole {
                     // Only add if the connection is short enough (local neighbors)
-                    let dist = ((x2 - x1).powi(2) + (y2 - y1).powi(2)).sqrt();
-                    if dist < spacing * 3.0 {
+                    let dist_sq = (x2 - x1) * (x2 - x1) + (y2 - y1) * (y2 - y1);
+                    let max_dist = spacing * 3.0;
+                    if dist_sq < max_dist * max_dist {
                         lines.push(Line::new(x1, y1, x2, y2));
                     }
                 }
@@ -10,7 +10,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 
 /// Generate L-system string for Sierpiński curve.
 fn generate_lsystem(depth: usize) -> String {
@@ -140,7 +140,7 @@ pub fn generate_sierpinski_fill(
     }
 
     // Clip to polygon
-    clip_lines_to_polygon(&lines, polygon)
+    clip_lines_in_bounds(&lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 #[cfg(test)]
@@ -4,7 +4,6 @@
 //! Useful for creating banded effects with grouped parallel lines.
 
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
 use super::util::{PatternContext, LineDirection};
 
 /// Configuration for stripe pattern.
@@ -97,7 +96,7 @@ pub fn generate_stripe_fill_configured(
         }
     }
 
-    clip_lines_to_polygon(&lines, polygon)
+    ctx.clip_lines(&lines)
 }
 
 #[cfg(test)]
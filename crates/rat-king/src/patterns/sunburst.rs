@@ -5,7 +5,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Point, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 
 /// Generate sunburst fill for a polygon.
 ///
@@ -74,7 +74,7 @@ pub fn generate_sunburst_fill(
     }
 
     // Clip to polygon
-    clip_lines_to_polygon(&all_lines, polygon)
+    clip_lines_in_bounds(&all_lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 /// Calculate the centroid of a polygon.
@@ -56,7 +56,22 @@ pub fn generate_truchet_fill(
     let angle_rad = angle_degrees * PI / 180.0;
 
     let cell_size = spacing * 2.0;
-    let arc_segments = 8; // Number of line segments per quarter-circle
+    let radius = cell_size / 2.0;
+    const ARC_SEGMENTS: usize = 8; // Number of line segments per quarter-circle
+
+    // Every arc is one of four quarter-circles of the same radius, so the
+    // vertex offsets are computed once here instead of per cell.
+    // Quadrant q spans angles q*PI/2 .. (q+1)*PI/2.
+    let mut quarter_arcs = [[(0.0, 0.0); ARC_SEGMENTS + 1]; 4];
+    for (q, arc) in quarter_arcs.iter_mut().enumerate() {
+        let start_angle = q as f64 * PI / 2.0;
+        let end_angle = (q + 1) as f64 * PI / 2.0;
+        for (i, offset) in arc.iter_mut().enumerate() {
+            let t = i as f64 / ARC_SEGMENTS as f64;
+            let a = start_angle + t * (end_angle - start_angle);
+            *offset = (radius * a.cos(), radius * a.sin());
+        }
+    }
 
     let diagonal = ((max_x - min_x).powi(2) + (max_y - min_y).powi(2)).sqrt();
     let padding = cell_size + diagonal / 2.0;
@@ -64,12 +79,13 @@ pub fn generate_truchet_fill(
     let mut lines = Vec::new();
     let mut rng = SimpleRng::new(42); // Fixed seed for reproducibility
 
+    let (sin_a, cos_a) = angle_rad.sin_cos();
     let rotate = |x: f64, y: f64| -> (f64, f64) {
         let dx = x - center_x;
         let dy = y - center_y;
         (
-            center_x + dx * angle_rad.cos() - dy * angle_rad.sin(),
-            center_y + dx * angle_rad.sin() + dy * angle_rad.cos(),
+            center_x + dx * cos_a - dy * sin_a,
+            center_y + dx * sin_a + dy * cos_a,
         )
     };
 
@@ -83,83 +99,34 @@ pub fn generate_truchet_fill(
             // Generate two quarter-circle arcs per cell
             // Arc 1: corner to corner
             // Arc 2: other corner to corner
-
-            let (arc1_cx, arc1_cy, arc2_cx, arc2_cy) = if flip {
-                // Arcs from top-left and bottom-right
-                (cell_x, cell_y, cell_x + cell_size, cell_y + cell_size)
+            let arcs = if flip {
+                // Arcs from top-left (bottom-right quadrant) and
+                // bottom-right (top-left quadrant)
+                [(cell_x, cell_y, 0), (cell_x + cell_size, cell_y + cell_size, 2)]
             } else {
-                // Arcs from top-right and bottom-left
-                (cell_x + cell_size, cell_y, cell_x, cell_y + cell_size)
+                // Arcs from top-right (bottom-left quadrant) and
+                // bottom-left (top-right quadrant)
+                [(cell_x + cell_size, cell_y, 1), (cell_x, cell_y + cell_size, 3)]
             };
 
-            let radius = cell_size / 2.0;
-
-            // Generate arc 1
-            for i in 0..arc_segments {
-                let t1 = i as f64 / arc_segments as f64;
-                let t2 = (i + 1) as f64 / arc_segments as f64;
-
-                let (start_angle, end_angle) = if flip {
-                    (0.0, PI / 2.0) // Bottom-right quadrant
-                } else {
-                    (PI / 2.0, PI) // Bottom-left quadrant
-                };
-
-                let a1 = start_angle + t1 * (end_angle - start_angle);
-                let a2 = start_angle + t2 * (end_angle - start_angle);
+            for (arc_cx, arc_cy, quadrant) in arcs {
+                for pair in quarter_arcs[quadrant].windows(2) {
+                    let (ox1, oy1) = pair[0];
+                    let (ox2, oy2) = pair[1];
 
-                let x1 = arc1_cx + radius * a1.cos();
-                let y1 = arc1_cy + radius * a1.sin();
-                let x2 = arc1_cx + radius * a2.cos();
-                let y2 = arc1_cy + radius * a2.sin();
+                    let (rx1, ry1) = rotate(arc_cx + ox1, arc_cy + oy1);
+                    let (rx2, ry2) = rotate(arc_cx + ox2, arc_cy + oy2);
 
-                let (rx1, ry1) = rotate(x1, y1);
-                let (rx2, ry2) = rotate(x2, y2);
-
-                let mid_x = (rx1 + rx2) / 2.0;
-                let mid_y = (ry1 + ry2) / 2.0;
-
-                if point_in_polygon(mid_x, mid_y, outer) {
-                    let in_hole = polygon.holes.iter().any(|hole| {
-                        point_in_polygon(mid_x, mid_y, hole)
-                    });
-                    if !in_hole {
-                        lines.push(Line::new(rx1, ry1, rx2, ry2));
-                    }
-                }
-            }
+                    let mid_x = (rx1 + rx2) / 2.0;
+                    let mid_y = (ry1 + ry2) / 2.0;
 
-            // Generate arc 2
-            for i in 0..arc_segments {
-                let t1 = i as f64 / arc_segments as f64;
-                let t2 = (i + 1) as f64 / arc_segments as f64;
-
-                let (start_angle, end_angle) = if flip {
-                    (PI, PI * 3.0 / 2.0) // Top-left quadrant
-                } else {
-                    (PI * 3.0 / 2.0, PI * 2.0) // Top-right quadrant
-                };
-
-                let a1 = start_angle + t1 * (end_angle - start_angle);
-                let a2 = start_angle + t2 * (end_angle - start_angle);
-
-                let x1 = arc2_cx + radius * a1.cos();
-                let y1 = arc2_cy + radius * a1.sin();
-                let x2 = arc2_cx + radius * a2.cos();
-                let y2 = arc2_cy + radius * a2.sin();
-
-                let (rx1, ry1) = rotate(x1, y1);
-                let (rx2, ry2) = rotate(x2, y2);
-
-                let mid_x = (rx1 + rx2) / 2.0;
-                let mid_y = (ry1 + ry2) / 2.0;
-
-                if point_in_polygon(mid_x, mid_y, outer) {
-                    let in_hole = polygon.holes.iter().any(|hole| {
-                        point_in_polygon(mid_x, mid_y, hole)
-                    });
-                    if !in_hole {
-                        lines.push(Line::new(rx1, ry1, rx2, ry2));
+                    if point_in_polygon(mid_x, mid_y, outer) {
+                        let in_hole = polygon.holes.iter().any(|hole| {
+                            point_in_polygon(mid_x, mid_y, hole)
+                        });
+                        if !in_hole {
+                            lines.push(Line::new(rx1, ry1, rx2, ry2));
+                        }
                     }
                 }
             }
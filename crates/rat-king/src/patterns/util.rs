@@ -5,7 +5,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Point, Polygon};
-use crate::clip::point_in_polygon;
+use crate::clip::{clip_lines_in_bounds, point_in_polygon};
 
 /// Context for pattern generation with pre-computed values.
 ///
@@ -81,6 +81,11 @@ impl<'a> PatternContext<'a> {
     /// Check if a point is inside the polygon body (not in holes).
     #[inline]
     pub fn point_inside(&self, x: f64, y: f64) -> bool {
+        // Cheap reject against the cached bounding box before the edge walk
+        let (min_x, min_y, max_x, max_y) = self.bounds;
+        if x < min_x || x > max_x || y < min_y || y > max_y {
+            return false;
+        }
         if !point_in_polygon(x, y, &self.polygon.outer) {
             return false;
         }
@@ -95,6 +100,12 @@ impl<'a> PatternContext<'a> {
         self.point_inside(mid_x, mid_y)
     }
 
+    /// Clip lines to the polygon body, reusing the cached bounding box.
+    #[inline]
+    pub fn clip_lines(&self, lines: &[Line]) -> Vec<Line> {
+        clip_lines_in_bounds(lines, self.polygon, self.bounds)
+    }
+
     /// Get padding amount for generating lines beyond bounds.
     #[inline]
     pub fn padding(&self) -> f64 {
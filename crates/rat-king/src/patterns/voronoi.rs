@@ -5,7 +5,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 use crate::rng::Rng;
 
 /// Generate Voronoi cell fill for a polygon.
@@ -64,6 +64,9 @@ pub fn generate_voronoi_fill(
     // For each pair of nearby seeds, create an edge
     let mut all_lines = Vec::new();
     let max_edge_dist = spacing * 2.5; // Only consider nearby seed pairs
+    // Pairs are rejected on squared distance; the sqrt is only taken for
+    // the few pairs that survive the cheap tests
+    let max_edge_dist_sq = max_edge_dist * max_edge_dist;
 
     for i in 0..seeds.len() {
         for j in (i + 1)..seeds.len() {
@@ -73,10 +76,10 @@ pub fn generate_voronoi_fill(
             // Distance between seeds
             let dx = x2 - x1;
             let dy = y2 - y1;
-            let dist = (dx * dx + dy * dy).sqrt();
+            let dist_sq = dx * dx + dy * dy;
 
             // Skip distant pairs
-            if dist > max_edge_dist {
+            if dist_sq > max_edge_dist_sq {
                 continue;
             }
 
@@ -91,6 +94,7 @@ pub fn generate_voronoi_fill(
             }
 
             // Perpendicular unit vector
+            let dist = dist_sq.sqrt();
             let px = -dy / dist;
             let py = dx / dist;
 
@@ -105,7 +109,7 @@ pub fn generate_voronoi_fill(
 
             // Simple validation: check if this edge is a valid Voronoi boundary
             // by ensuring no other seed is closer to the midpoint
-            let mid_dist_sq = dist * dist / 4.0; // Distance from midpoint to either seed
+            let mid_dist_sq = dist_sq / 4.0; // Distance from midpoint to either seed
             let mut valid = true;
 
             for (k, &(sx, sy)) in seeds.iter().enumerate() {
@@ -134,12 +138,13 @@ pub fn generate_voronoi_fill(
 
                 let dx = x2 - x1;
                 let dy = y2 - y1;
-                let dist = (dx * dx + dy * dy).sqrt();
+                let dist_sq = dx * dx + dy * dy;
 
-                if dist > max_edge_dist || dist < 0.001 {
+                if dist_sq > max_edge_dist_sq || dist_sq < 0.001 * 0.001 {
                     continue;
                 }
 
+                let dist = dist_sq.sqrt();
                 let mx = (x1 + x2) / 2.0;
                 let my = (y1 + y2) / 2.0;
 
@@ -158,7 +163,7 @@ pub fn generate_voronoi_fill(
     }
 
     // Clip all lines to polygon
-    clip_lines_to_polygon(&all_lines, polygon)
+    clip_lines_in_bounds(&all_lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 #[cfg(test)]
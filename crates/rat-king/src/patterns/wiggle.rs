@@ -5,7 +5,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Point, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 use super::tessellation::triangulate;
 
 /// Generate wiggle (sinusoidal wave) fill for a polygon.
@@ -86,7 +86,7 @@ fn generate_wiggle_fill_direct(
         }
     }
 
-    clip_lines_to_polygon(&lines, polygon)
+    clip_lines_in_bounds(&lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 /// Tessellation-based wiggle fill - much faster for complex polygons.
@@ -5,7 +5,7 @@
 
 use std::f64::consts::PI;
 use crate::geometry::{Line, Point, Polygon};
-use crate::clip::clip_lines_to_polygon;
+use crate::clip::clip_lines_in_bounds;
 use crate::rng::Rng;
 
 /// Configuration for zigzag pattern.
@@ -163,7 +163,7 @@ pub fn generate_zigzag_fill_configured(polygon: &Polygon, config: &ZigzagConfig)
     }
 
     // Clip all lines to polygon
-    clip_lines_to_polygon(&all_lines, polygon)
+    clip_lines_in_bounds(&all_lines, polygon, (min_x, min_y, max_x, max_y))
 }
 
 /// Rotate a point around a center.
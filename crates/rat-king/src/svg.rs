@@ -15,10 +15,10 @@
 //! quick-xml pre-parsing since usvg doesn't preserve them.
 
 use std::collections::HashMap;
-use crate::clip::point_in_polygon;
+use crate::clip::all_points_in_polygon;
 use crate::geometry::{Point, Polygon};
 use lyon_geom::{CubicBezierSegment, QuadraticBezierSegment, point};
-use quick_xml::events::Event;
+use quick_xml::events::{BytesStart, Event};
 use quick_xml::reader::Reader;
 
 /// Error type for SVG parsing.
@@ -73,71 +73,117 @@ fn extract_data_attributes(svg_content: &str) -> (HashMap<String, PathDataAttrs>
     let mut reader = Reader::from_str(svg_content);
     reader.config_mut().trim_text(true);
 
-    let mut buf = Vec::new();
+    // Nesting depth inside a subtree usvg never renders in place (defs,
+    // clipPath, display:none, ...). Shapes in there must not take a slot in
+    // `by_order`, but keep their by-ID entry since `<use>` can instance them
+    let mut skip_depth = 0usize;
 
+    // Reading from a &str, events borrow straight from the input rather than
+    // being copied into an intermediate buffer
     loop {
-        match reader.read_event_into(&mut buf) {
-            Ok(Event::Empty(e)) | Ok(Event::Start(e)) => {
-                let name = e.name();
-                let name_str = std::str::from_utf8(name.as_ref()).unwrap_or("");
-
-                if name_str == "path" || name_str == "rect" || name_str == "circle"
-                   || name_str == "ellipse" || name_str == "polygon" || name_str == "polyline" {
-                    let mut id: Option<String> = None;
-                    let mut data_pattern: Option<String> = None;
-                    let mut data_shade: Option<u8> = None;
-                    let mut data_spacing: Option<f64> = None;
-                    let mut data_angle: Option<f64> = None;
-                    let mut data_color: Option<String> = None;
-                    let mut stroke_color: Option<String> = None;
-                    let mut stroke_width: Option<f64> = None;
-
-                    for attr in e.attributes().flatten() {
-                        let key = std::str::from_utf8(attr.key.as_ref()).unwrap_or("");
-                        let value = std::str::from_utf8(&attr.value).unwrap_or("");
-
-                        match key {
-                            "id" => id = Some(value.to_string()),
-                            "data-pattern" => data_pattern = Some(value.to_string()),
-                            "data-shade" => data_shade = value.parse().ok(),
-                            "data-spacing" => data_spacing = value.parse().ok(),
-                            "data-angle" => data_angle = value.parse().ok(),
-                            "data-color" => data_color = Some(value.to_string()),
-                            "stroke" => stroke_color = Some(value.to_string()),
-                            "stroke-width" => stroke_width = value.parse().ok(),
-                            _ => {}
-                        }
-                    }
+        let (e, is_start) = match reader.read_event() {
+            Ok(Event::Start(e)) => (e, true),
+            Ok(Event::Empty(e)) => (e, false),
+            Ok(Event::End(_)) => {
+                skip_depth = skip_depth.saturating_sub(1);
+                continue;
+            }
+            Ok(Event::Eof) | Err(_) => break,
+            _ => continue,
+        };
 
-                    let attrs = PathDataAttrs {
-                        data_pattern, data_shade, data_spacing, data_angle,
-                        data_color, stroke_color, stroke_width,
-                    };
+        let unrendered = skip_depth > 0 || is_unrendered(&e);
+        if unrendered && is_start {
+            skip_depth += 1;
+        }
 
-                    // Store by ID if available
-                    let has_attrs = attrs.data_pattern.is_some() || attrs.data_shade.is_some()
-                        || attrs.data_spacing.is_some() || attrs.data_angle.is_some()
-                        || attrs.data_color.is_some() || attrs.stroke_color.is_some();
-                    if let Some(path_id) = id {
-                        if has_attrs {
-                            by_id.insert(path_id, attrs.clone());
-                        }
-                    }
+        // Compare the local name as raw bytes: no UTF-8 decoding per
+        // element, and prefixed tags like `svg:path` still match
+        let local_name = e.local_name();
 
-                    // Always store in order list (for position-based matching)
-                    by_order.push(attrs);
+        if matches!(
+            local_name.as_ref(),
+            b"path" | b"rect" | b"circle" | b"ellipse" | b"polygon" | b"polyline"
+        ) {
+            let mut id: Option<String> = None;
+            let mut data_pattern: Option<String> = None;
+            let mut data_shade: Option<u8> = None;
+            let mut data_spacing: Option<f64> = None;
+            let mut data_angle: Option<f64> = None;
+            let mut data_color: Option<String> = None;
+            let mut stroke_color: Option<String> = None;
+            let mut stroke_width: Option<f64> = None;
+
+            // Dispatch on the raw key bytes and only decode the values we
+            // keep - large attributes like `d` are never UTF-8 validated
+            for attr in e.attributes().flatten() {
+                let value = &attr.value;
+
+                match attr.key.as_ref() {
+                    b"id" => id = Some(attr_str(value).to_string()),
+                    b"data-pattern" => data_pattern = Some(attr_str(value).to_string()),
+                    b"data-shade" => data_shade = attr_str(value).parse().ok(),
+                    b"data-spacing" => data_spacing = attr_str(value).parse().ok(),
+                    b"data-angle" => data_angle = attr_str(value).parse().ok(),
+                    b"data-color" => data_color = Some(attr_str(value).to_string()),
+                    b"stroke" => stroke_color = Some(attr_str(value).to_string()),
+                    b"stroke-width" => stroke_width = attr_str(value).parse().ok(),
+                    _ => {}
                 }
             }
-            Ok(Event::Eof) => break,
-            Err(_) => break,
-            _ => {}
+
+            let attrs = PathDataAttrs {
+                data_pattern, data_shade, data_spacing, data_angle,
+                data_color, stroke_color, stroke_width,
+            };
+
+            // Store by ID if available
+            let has_attrs = attrs.data_pattern.is_some() || attrs.data_shade.is_some()
+                || attrs.data_spacing.is_some() || attrs.data_angle.is_some()
+                || attrs.data_color.is_some() || attrs.stroke_color.is_some();
+            if let Some(path_id) = id {
+                if has_attrs {
+                    by_id.insert(path_id, attrs.clone());
+                }
+            }
+
+            // Store every rendered shape in order (for position-based matching)
+            if !unrendered {
+                by_order.push(attrs);
+            }
         }
-        buf.clear();
     }
 
     (by_id, by_order)
 }
 
+/// Whether an element starts a subtree that usvg never renders as paths:
+/// resource containers like `<defs>` and `<clipPath>`, or anything hidden
+/// with `display="none"` (also as an inline style, as Inkscape writes it).
+fn is_unrendered(e: &BytesStart) -> bool {
+    if matches!(
+        e.local_name().as_ref(),
+        b"defs" | b"symbol" | b"clipPath" | b"mask" | b"pattern" | b"marker"
+    ) {
+        return true;
+    }
+
+    e.attributes().flatten().any(|attr| match attr.key.as_ref() {
+        b"display" => attr_str(&attr.value).trim() == "none",
+        b"style" => attr_str(&attr.value).split(';').any(|decl| {
+            decl.split_once(':')
+                .is_some_and(|(key, value)| key.trim() == "display" && value.trim() == "none")
+        }),
+        _ => false,
+    })
+}
+
+/// Decode an attribute value, treating invalid UTF-8 as empty.
+#[inline]
+fn attr_str(value: &[u8]) -> &str {
+    std::str::from_utf8(value).unwrap_or("")
+}
+
 /// Extract all polygons from an SVG file.
 ///
 /// ## Rust Lesson #21: The ? Operator
@@ -160,11 +206,9 @@ pub fn extract_polygons_from_svg(svg_content: &str) -> Result<Vec<Polygon>, SvgE
         .map_err(|e| SvgError::ParseError(e.to_string()))?;
 
     let mut polygons = Vec::new();
-    let mut path_index = 0usize;
 
     // Walk the tree and collect paths (root is a Group in usvg 0.45)
-    // Pass None as parent_group_id for the root
-    extract_from_group(tree.root(), &mut polygons, None, &attrs_by_id, &attrs_by_order, &mut path_index);
+    extract_from_group(tree.root(), &mut polygons, &attrs_by_id, &attrs_by_order);
 
     if polygons.is_empty() {
         Err(SvgError::NoPolygons)
@@ -173,67 +217,64 @@ pub fn extract_polygons_from_svg(svg_content: &str) -> Result<Vec<Polygon>, SvgE
     }
 }
 
-/// Recursively extract polygons from a usvg Group.
+/// Extract polygons from a usvg Group and everything nested inside it.
 /// Tracks the nearest parent group ID for per-group styling support.
+///
+/// Walks an explicit worklist rather than recursing, so deeply nested
+/// editor output can't exhaust the stack. Children are pushed in reverse
+/// so paths are still visited in document order, which position-based
+/// attribute matching depends on.
 fn extract_from_group(
-    group: &usvg::Group,
+    root: &usvg::Group,
     polygons: &mut Vec<Polygon>,
-    parent_group_id: Option<&str>,
     attrs_by_id: &HashMap<String, PathDataAttrs>,
     attrs_by_order: &[PathDataAttrs],
-    path_index: &mut usize,
 ) {
-    // Use this group's ID if it has one, otherwise inherit from parent
-    let current_group_id = if group.id().is_empty() {
-        parent_group_id
-    } else {
-        Some(group.id())
-    };
+    let mut path_index = 0usize;
 
-    for child in group.children() {
-        extract_from_node(child, polygons, current_group_id, attrs_by_id, attrs_by_order, path_index);
+    // Use a group's ID if it has one, otherwise inherit from its parent
+    fn nearest_group_id<'a>(group: &'a usvg::Group, parent: Option<&'a str>) -> Option<&'a str> {
+        if group.id().is_empty() { parent } else { Some(group.id()) }
     }
-}
-
-/// Recursively extract polygons from a usvg node.
-fn extract_from_node(
-    node: &usvg::Node,
-    polygons: &mut Vec<Polygon>,
-    parent_group_id: Option<&str>,
-    attrs_by_id: &HashMap<String, PathDataAttrs>,
-    attrs_by_order: &[PathDataAttrs],
-    path_index: &mut usize,
-) {
-    // ## Rust Lesson #22: Pattern Matching on Enums with Data
-    //
-    // usvg::Node is an enum with variants that carry different data.
-    // We match on the variant and destructure to get the inner data.
 
-    match node {
-        usvg::Node::Group(group) => {
-            // Recurse into groups, passing current group ID
-            extract_from_group(group, polygons, parent_group_id, attrs_by_id, attrs_by_order, path_index);
-        }
-        usvg::Node::Path(path) => {
-            // Extract all polygons from path data (handles compound paths)
-            let group_id = parent_group_id.map(|s| s.to_string());
-
-            // Look up data attributes: first try by ID, then fall back to position-based matching
-            let path_id = path.id();
-            let attrs = if !path_id.is_empty() {
-                attrs_by_id.get(path_id).cloned()
-            } else {
-                // Fall back to position-based matching
-                attrs_by_order.get(*path_index).cloned()
-            };
+    // (node, nearest parent group ID); the root itself has no parent
+    let mut stack: Vec<(&usvg::Node, Option<&str>)> = Vec::new();
+    let root_id = nearest_group_id(root, None);
+    stack.extend(root.children().iter().rev().map(|child| (child, root_id)));
+
+    while let Some((node, parent_group_id)) = stack.pop() {
+        // ## Rust Lesson #22: Pattern Matching on Enums with Data
+        //
+        // usvg::Node is an enum with variants that carry different data.
+        // We match on the variant and destructure to get the inner data.
+
+        match node {
+            usvg::Node::Group(group) => {
+                // Queue the group's children, passing the current group ID
+                let current_group_id = nearest_group_id(group, parent_group_id);
+                stack.extend(group.children().iter().rev().map(|child| (child, current_group_id)));
+            }
+            usvg::Node::Path(path) => {
+                // Extract all polygons from path data (handles compound paths)
+                let group_id = parent_group_id.map(|s| s.to_string());
+
+                // Look up data attributes: first try by ID, then fall back to position-based matching
+                let path_id = path.id();
+                let attrs = if !path_id.is_empty() {
+                    attrs_by_id.get(path_id).cloned()
+                } else {
+                    // Fall back to position-based matching
+                    attrs_by_order.get(path_index).cloned()
+                };
 
-            // Increment path index for position-based matching
-            *path_index += 1;
+                // Increment path index for position-based matching
+                path_index += 1;
 
-            polygons.extend(path_to_polygons(path, group_id, attrs));
+                polygons.extend(path_to_polygons(path, group_id, attrs));
+            }
+            // Ignore text, images, etc.
+            _ => {}
         }
-        // Ignore text, images, etc.
-        _ => {}
     }
 }
 
@@ -320,8 +361,11 @@ fn path_to_polygons(path: &usvg::Path, group_id: Option<String>, attrs: Option<P
             } else {
                 Some(format!("{}_{}", id, subpath_idx))
             };
+            // Copy out an exact-size outline (no growth slack held for the
+            // polygon's lifetime) and keep `points` as the scratch buffer
+            // for the next subpath, so it doesn't regrow from empty
             let polygon = Polygon::with_metadata(
-                std::mem::take(points),
+                points.to_vec(),
                 polygon_id,
                 grp_id.clone(),
                 pat.clone(),
@@ -332,6 +376,7 @@ fn path_to_polygons(path: &usvg::Path, group_id: Option<String>, attrs: Option<P
                 stroke_col.clone(),
                 stroke_w,
             );
+            points.clear();
             return Some(polygon);
         }
         points.clear();
@@ -473,62 +518,79 @@ fn assemble_holes(polygons: Vec<Polygon>) -> Vec<Polygon> {
     // Track which polygons are holes (and their parent index)
     let mut hole_of: Vec<Option<usize>> = vec![None; polygons.len()];
 
-    // For each polygon, check if it's contained within another
-    for i in 0..polygons.len() {
-        let (area_i, bbox_i) = polygon_data[i];
-        let Some((min_x_i, min_y_i, max_x_i, max_y_i)) = bbox_i else {
-            continue;
+    // Record `parent` as the hole parent of `child` if it qualifies.
+    let mut consider = |child: usize, parent: usize| {
+        let (area_c, bbox_c) = polygon_data[child];
+        let (area_p, bbox_p) = polygon_data[parent];
+        let (Some((min_x_c, min_y_c, max_x_c, max_y_c)), Some((min_x_p, min_y_p, max_x_p, max_y_p))) =
+            (bbox_c, bbox_p) else {
+            return;
         };
 
-        for j in 0..polygons.len() {
-            if i == j {
-                continue;
-            }
-
-            let (area_j, bbox_j) = polygon_data[j];
-            let Some((min_x_j, min_y_j, max_x_j, max_y_j)) = bbox_j else {
-                continue;
-            };
-
-            // Quick bounding box rejection: i must be inside j's bbox
-            if min_x_i < min_x_j || max_x_i > max_x_j ||
-               min_y_i < min_y_j || max_y_i > max_y_j {
-                continue;
-            }
-
-            // Check for opposite winding direction (indicates hole relationship)
-            // In SVG coordinate space: outer is typically CCW (positive area),
-            // holes are typically CW (negative area)
-            let opposite_winding = (area_i > 0.0) != (area_j > 0.0);
-            if !opposite_winding {
-                continue;
-            }
+        // Quick bounding box rejection: child must be inside parent's bbox
+        if min_x_c < min_x_p || max_x_c > max_x_p ||
+           min_y_c < min_y_p || max_y_c > max_y_p {
+            return;
+        }
 
-            // Polygon i (smaller) should be contained in polygon j (larger)
-            // Check if j has larger absolute area (is the outer)
-            if area_i.abs() >= area_j.abs() {
-                continue;
-            }
+        // Check for opposite winding direction (indicates hole relationship)
+        // In SVG coordinate space: outer is typically CCW (positive area),
+        // holes are typically CW (negative area)
+        let opposite_winding = (area_c > 0.0) != (area_p > 0.0);
+        if !opposite_winding {
+            return;
+        }
 
-            // Check if all vertices of i are inside j
-            let all_inside = polygons[i].outer.iter().all(|p| {
-                point_in_polygon(p.x, p.y, &polygons[j].outer)
-            });
+        // Child (smaller) should be contained in parent (larger)
+        if area_c.abs() >= area_p.abs() {
+            return;
+        }
 
-            if all_inside {
-                // i is a hole of j
-                // If i is already marked as a hole of something else, prefer
-                // the smallest containing polygon (most immediate parent)
-                if let Some(existing_parent) = hole_of[i] {
-                    let existing_area = polygon_data[existing_parent].0.abs();
-                    if area_j.abs() < existing_area {
-                        hole_of[i] = Some(j);
-                    }
-                } else {
-                    hole_of[i] = Some(j);
+        // Check if all vertices of child are inside parent
+        let all_inside = all_points_in_polygon(&polygons[child].outer, &polygons[parent].outer);
+
+        if all_inside {
+            // If already marked as a hole of something else, prefer the
+            // smallest containing polygon (most immediate parent), breaking
+            // ties by document order
+            let better = match hole_of[child] {
+                Some(existing) => {
+                    let existing_area = polygon_data[existing].0.abs();
+                    area_p.abs() < existing_area
+                        || (area_p.abs() == existing_area && parent < existing)
                 }
+                None => true,
+            };
+            if better {
+                hole_of[child] = Some(parent);
             }
         }
+    };
+
+    // Sweep along x instead of testing all n^2 pairs. Two polygons can only
+    // be nested if their x-extents overlap, so visit polygons in order of
+    // min_x and keep an "active" list of those whose max_x the sweep hasn't
+    // passed yet. Only active pairs are tested (in both directions).
+    // Disjoint shapes - the common case for glyphs and stamps - drop out of
+    // the active list quickly, giving roughly O(n log n) behaviour.
+    let mut by_min_x: Vec<usize> = (0..polygons.len())
+        .filter(|&i| polygon_data[i].1.is_some())
+        .collect();
+    by_min_x.sort_by(|&a, &b| {
+        let min_x = |i: usize| polygon_data[i].1.map_or(0.0, |bbox| bbox.0);
+        min_x(a).total_cmp(&min_x(b))
+    });
+
+    let mut active: Vec<usize> = Vec::new();
+    for &i in &by_min_x {
+        let min_x_i = polygon_data[i].1.map_or(0.0, |bbox| bbox.0);
+        active.retain(|&j| polygon_data[j].1.map_or(false, |bbox| bbox.2 >= min_x_i));
+
+        for &j in &active {
+            consider(i, j);
+            consider(j, i);
+        }
+        active.push(i);
     }
 
     // Collect holes for each outer polygon
@@ -598,6 +660,87 @@ mod tests {
         assert_eq!(polygons.len(), 1);
     }
 
+    #[test]
+    fn data_attributes_match_prefixed_elements() {
+        let svg = r#"
+            <svg:svg xmlns:svg="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+                <svg:rect x="10" y="10" width="80" height="80" data-pattern="spiral" data-spacing="3"/>
+            </svg:svg>
+        "#;
+
+        let (_, by_order) = extract_data_attributes(svg);
+        assert_eq!(by_order.len(), 1);
+        assert_eq!(by_order[0].data_pattern.as_deref(), Some("spiral"));
+        assert_eq!(by_order[0].data_spacing, Some(3.0));
+    }
+
+    #[test]
+    fn data_attributes_skip_unrendered_subtrees() {
+        let svg = r#"
+            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+                <defs>
+                    <clipPath id="clip"><rect width="10" height="10" data-pattern="stripe"/></clipPath>
+                    <path id="motif" d="M 0,0 L 5,0 L 5,5 Z" data-pattern="zigzag"/>
+                </defs>
+                <g style="fill:red; display: none"><rect width="50" height="50"/></g>
+                <rect x="10" y="10" width="80" height="80" data-pattern="spiral"/>
+            </svg>
+        "#;
+
+        let (by_id, by_order) = extract_data_attributes(svg);
+        // Only the visible rect takes a position, so it lines up with usvg's paths
+        assert_eq!(by_order.len(), 1);
+        assert_eq!(by_order[0].data_pattern.as_deref(), Some("spiral"));
+        // Shapes in <defs> can still be instanced by <use>, so keep them by ID
+        assert_eq!(by_id["motif"].data_pattern.as_deref(), Some("zigzag"));
+
+        let polygons = extract_polygons_from_svg(svg).unwrap();
+        assert_eq!(polygons.len(), 1);
+        assert_eq!(polygons[0].data_pattern.as_deref(), Some("spiral"));
+    }
+
+    #[test]
+    fn nested_groups_keep_group_ids_and_document_order() {
+        // Unnamed groups inherit the nearest named ancestor's ID, and a
+        // path after a closed inner group goes back to the outer one
+        let svg = r#"
+            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+                <rect x="0" y="0" width="10" height="10" data-pattern="a"/>
+                <g id="outer">
+                    <rect x="15" y="0" width="10" height="10" data-pattern="b"/>
+                    <g>
+                        <rect x="30" y="0" width="10" height="10" data-pattern="c"/>
+                        <g id="inner">
+                            <g><rect x="45" y="0" width="10" height="10" data-pattern="d"/></g>
+                        </g>
+                        <rect x="60" y="0" width="10" height="10" data-pattern="e"/>
+                    </g>
+                </g>
+                <g><rect x="75" y="0" width="10" height="10" data-pattern="f"/></g>
+            </svg>
+        "#;
+
+        let polygons = extract_polygons_from_svg(svg).unwrap();
+        let found: Vec<(Option<&str>, Option<&str>)> = polygons
+            .iter()
+            .map(|p| (p.group_id.as_deref(), p.data_pattern.as_deref()))
+            .collect();
+        assert_eq!(found, vec![
+            (None, Some("a")),
+            (Some("outer"), Some("b")),
+            (Some("outer"), Some("c")),
+            (Some("inner"), Some("d")),
+            (Some("outer"), Some("e")),
+            (None, Some("f")),
+        ]);
+
+        // Document order also holds geometrically: each rect is 15 units right of the last
+        for (i, polygon) in polygons.iter().enumerate() {
+            let min_x = polygon.outer.iter().map(|p| p.x).fold(f64::INFINITY, f64::min);
+            assert!((min_x - 15.0 * i as f64).abs() < 1e-6, "polygon {} starts at x={}", i, min_x);
+        }
+    }
+
     #[test]
     fn no_polygons_error() {
         let svg = r#"